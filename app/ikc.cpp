@@ -4,6 +4,7 @@
 #include <thread>
 
 #include "../lib/io/graph_io.h"
+#include "../lib/io/cluster_io.h"
 #include "../lib/data_structures/graph.h"
 #include "../lib/algorithms/ikc.h"
 
@@ -19,27 +20,10 @@ void print_usage(const char* program_name) {
 }
 
 void write_clusters_to_csv(const std::string& output_file, const std::vector<Cluster>& clusters, bool tsv_format = false) {
-    std::ofstream out(output_file);
-    if (!out.is_open()) {
-        std::cerr << "Error: Could not open output file: " << output_file << std::endl;
+    if (!write_clusters(output_file, clusters, tsv_format)) {
+        std::cerr << "Error: Could not write output file: " << output_file << std::endl;
         return;
     }
-
-    size_t cluster_index = 0;
-    for (const auto& cluster : clusters) {
-        cluster_index++;
-        for (uint64_t node : cluster.nodes) {
-            if (tsv_format) {
-                // TSV format: node_id<tab>cluster_id
-                out << node << "\t" << cluster_index << "\n";
-            } else {
-                // CSV format: node_id,cluster_index,k_value,modularity
-                out << node << "," << cluster_index << "," << cluster.k_value << "," << cluster.modularity << "\n";
-            }
-        }
-    }
-
-    out.close();
     std::cout << "Results written to: " << output_file << std::endl;
 }
 
@@ -95,7 +79,13 @@ int main(int argc, char* argv[]) {
     if (!quiet) {
         std::cout << "Loading graph..." << std::endl;
     }
-    Graph graph = load_undirected_tsv_edgelist_parallel(graph_file, num_threads, !quiet);
+    Graph graph;
+    try {
+        graph = load_undirected_tsv_edgelist_parallel(graph_file, num_threads, !quiet);
+    } catch (const std::system_error& e) {
+        std::cerr << "Error: Failed to open graph file " << e.what() << std::endl;
+        return 1;
+    }
 
     if (graph.num_nodes == 0) {
         std::cerr << "Error: Failed to load graph or graph is empty." << std::endl;
@@ -7,6 +7,7 @@ This is much simpler and faster than minimum k-core search!
 """
 
 import ikc
+import numpy as np
 from pathlib import Path
 
 
@@ -68,8 +69,8 @@ def main():
     print(f"Finding maximal k-cores for {len(query_nodes)} nodes using cached decomposition:")
     print()
 
-    for node in query_nodes:
-        result = g.find_maximal_kcore(node, core_numbers=kcore.core_numbers)
+    results = g.find_maximal_kcores(query_nodes, core_numbers=kcore.core_numbers)
+    for node, result in zip(query_nodes, results):
         if result:
             print(f"  Node {node:5d}: {result['k']:3d}-core with {result['size']:5d} nodes")
     print()
@@ -80,12 +81,13 @@ def main():
     print("-" * 70)
 
     # Find nodes with maximum core number
-    max_core_nodes = [i for i, cn in enumerate(kcore.core_numbers) if cn == kcore.max_core]
+    core_numbers = np.asarray(kcore.core_numbers)
+    max_core_nodes = np.flatnonzero(core_numbers == kcore.max_core)
     print(f"Nodes in the {kcore.max_core}-core (highest): {len(max_core_nodes)} nodes")
 
-    if max_core_nodes:
+    if len(max_core_nodes) > 0:
         # Show maximal k-core for a node with highest coreness
-        sample_node = max_core_nodes[0]
+        sample_node = max_core_nodes[0].item()
         result = g.find_maximal_kcore(sample_node, core_numbers=kcore.core_numbers)
         if result:
             print(f"\nMaximal k-core for node {sample_node} (one of the highest coreness nodes):")
@@ -104,8 +106,8 @@ def main():
     print(f"Nodes of interest: {nodes_of_interest}")
     print()
 
-    for node in nodes_of_interest:
-        result = g.find_maximal_kcore(node, core_numbers=kcore.core_numbers)
+    results = g.find_maximal_kcores(nodes_of_interest, core_numbers=kcore.core_numbers)
+    for node, result in zip(nodes_of_interest, results):
         if result:
             print(f"Node {node}:")
             print(f"  - Belongs to {result['k']}-core (max k for this node)")
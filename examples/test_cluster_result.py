@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Simple test for saving and converting clustering results.
+"""
+import csv
+import ikc
+import numpy as np
+import os
+import tempfile
+
+# Clique on nodes 0-3 joined by the edge (3,4) to the triangle (nodes 4,5,6),
+# so that IKC finds a 3-core and a 2-core cluster
+TEST_EDGES = [
+    (0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3),  # Clique
+    (4, 5), (5, 6), (6, 4),  # Triangle
+    (3, 4),  # Connection
+]
+
+# Column dtypes of ClusterResult.data
+DATA_DTYPES = {
+    'node_id': np.int64,
+    'cluster_id': np.int32,
+    'k_value': np.int32,
+    'modularity': np.float64,
+}
+
+def create_test_result():
+    """Cluster a small in-memory test graph."""
+    result = ikc.StreamingGraph.from_edges(TEST_EDGES).ikc(min_k=0)
+    assert result.num_clusters == 2, result
+    return result
+
+def temp_path(suffix):
+    """Return the path of a new, empty temporary file."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return path
+
+def test_data():
+    """Test the record array the other outputs are checked against."""
+    print("Testing ClusterResult.data...")
+
+    data = create_test_result().data
+    assert data.dtype.names == tuple(DATA_DTYPES), data.dtype
+    for name, dtype in DATA_DTYPES.items():
+        assert data[name].dtype == dtype, (name, data[name].dtype)
+    assert sorted(data.node_id.tolist()) == list(range(7)), data
+    assert sorted(set(data.k_value.tolist())) == [2, 3], data
+    print(f"  ✓ {len(data)} rows with columns {', '.join(data.dtype.names)}")
+
+def test_save_csv():
+    """Test that the CSV output reads back as all columns with a header."""
+    print("Testing save() as CSV...")
+
+    result = create_test_result()
+    path = temp_path('.csv')
+    try:
+        result.save(path)
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))
+    finally:
+        os.unlink(path)
+
+    assert rows[0] == list(DATA_DTYPES), rows[0]
+    expected = [(int(n), int(c), int(k), float(m)) for n, c, k, m in result.data]
+    # Modularity is written in its shortest round-trip form, so it reads back exactly
+    actual = [(int(n), int(c), int(k), float(m)) for n, c, k, m in rows[1:]]
+    assert actual == expected, (actual, expected)
+    print(f"  ✓ CSV round-trips {len(actual)} rows")
+
+def test_save_tsv():
+    """Test that the TSV output reads back as node_id and cluster_id only."""
+    print("Testing save() as TSV...")
+
+    result = create_test_result()
+    path = temp_path('.tsv')
+    try:
+        result.save(path, tsv=True)
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f, delimiter='\t'))
+    finally:
+        os.unlink(path)
+
+    assert all(len(row) == 2 for row in rows), "TSV should have two columns"
+    expected = list(zip(result.data.node_id.tolist(), result.data.cluster_id.tolist()))
+    actual = [(int(n), int(c)) for n, c in rows]
+    assert actual == expected, (actual, expected)
+    print(f"  ✓ TSV round-trips {len(actual)} rows without a header")
+
+def test_save_parquet():
+    """Test that the Parquet output reads back with the same columns and dtypes."""
+    print("Testing save() as Parquet...")
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("  - Skipped: pyarrow is not installed")
+        return
+
+    result = create_test_result()
+    path = temp_path('.parquet')
+    try:
+        result.save(path, format='parquet')
+        table = pq.read_table(path)
+    finally:
+        os.unlink(path)
+
+    assert table.column_names == list(DATA_DTYPES), table.column_names
+    for name, dtype in DATA_DTYPES.items():
+        column = table.column(name).to_numpy()
+        assert column.dtype == dtype, (name, column.dtype)
+        assert np.array_equal(column, result.data[name]), name
+    print(f"  ✓ Parquet round-trips {table.num_rows} rows")
+
+def test_to_dataframe():
+    """Test that to_dataframe() matches the record array."""
+    print("Testing to_dataframe()...")
+
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        print("  - Skipped: pandas is not installed")
+        return
+
+    result = create_test_result()
+    df = result.to_dataframe()
+    assert list(df.columns) == list(DATA_DTYPES), list(df.columns)
+    for name, dtype in DATA_DTYPES.items():
+        assert df[name].dtype == dtype, (name, df[name].dtype)
+        assert np.array_equal(df[name].to_numpy(), result.data[name]), name
+    print(f"  ✓ DataFrame matches data: {len(df)} rows")
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Cluster Result Tests")
+    print("=" * 60)
+    print()
+
+    test_data()
+    print()
+
+    test_save_csv()
+    print()
+
+    test_save_tsv()
+    print()
+
+    test_save_parquet()
+    print()
+
+    test_to_dataframe()
+    print()
+
+    print("=" * 60)
+    print("All tests completed!")
+    print("=" * 60)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Simple test for the k-core search functionality.
+"""
+import ikc
+import os
+import tempfile
+
+# Triangle (nodes 0,1,2) joined by the edge (2,3) to the square (nodes 3,4,5,6)
+TEST_EDGES = [
+    (0, 1),
+    (1, 2),
+    (2, 0),  # Triangle
+    (3, 4),
+    (4, 5),
+    (5, 6),
+    (6, 3),  # Square
+    (2, 3),  # Connection
+]
+
+def load_test_graph(edges=TEST_EDGES):
+    """Load an edge list through a temporary TSV file."""
+    fd, path = tempfile.mkstemp(suffix='.tsv', text=True)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            for u, v in edges:
+                f.write(f"{u}\t{v}\n")
+        return ikc.load_graph(path)
+    finally:
+        os.unlink(path)
+
+def test_kcore_searches():
+    """Test the k-core searches on a loaded graph."""
+    print("Testing k-core searches...")
+
+    g = load_test_graph()
+
+    # The whole graph is one 2-core component, although the triangle alone
+    # is a smaller connected 2-core; the search reports the component
+    result = g.find_smallest_kcore_component(k=2)
+    assert result['size'] == 7, result
+    assert sorted(result['nodes'].tolist()) == list(range(7)), result
+    assert g.find_smallest_kcore_component(k=3) is None, "Graph has no 3-core"
+    print(f"  ✓ Smallest 2-core component has {result['size']} nodes")
+
+    # A node that is not in the graph is reported as None, in query order
+    results = g.find_maximal_kcores([0, 999, 6])
+    assert len(results) == 3, results
+    assert results[1] is None, "Missing node should be reported as None"
+    assert results[0]['k'] == 2 and results[0]['size'] == 7, results[0]
+    assert results[2]['k'] == 2 and results[2]['size'] == 7, results[2]
+    assert g.find_maximal_kcore(999) is None, "Missing node should be reported as None"
+    print(f"  ✓ Missing query node reported as None")
+
+def test_core_numbers_size_mismatch():
+    """Test that core numbers of the wrong length are rejected."""
+    print("Testing core numbers of the wrong length...")
+
+    g = load_test_graph()
+    short = [5] * 3
+
+    try:
+        g.find_maximal_kcore(0, core_numbers=short)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"  ✓ find_maximal_kcore raised ValueError: {e}")
+
+    try:
+        g.find_maximal_kcores([0, 1], core_numbers=short)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"  ✓ find_maximal_kcores raised ValueError: {e}")
+
+    # Not reported as None, which would read as "the graph has no k-core"
+    try:
+        g.find_smallest_kcore_component(k=2, core_numbers=short)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"  ✓ find_smallest_kcore_component raised ValueError: {e}")
+
+    # A decomposition of another graph is rejected the same way
+    other = load_test_graph(TEST_EDGES[:3])
+    try:
+        g.find_maximal_kcore(0, core_numbers=other.kcore_decomposition.core_numbers)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    try:
+        ikc._ikc.find_maximal_kcore(g._graph, 0, other.kcore_decomposition)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    try:
+        ikc._ikc.find_smallest_kcore_component(g._graph, 2, other.kcore_decomposition)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    print(f"  ✓ Decomposition of another graph rejected")
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("K-Core Search Tests")
+    print("=" * 60)
+    print()
+
+    test_kcore_searches()
+    print()
+
+    test_core_numbers_size_mismatch()
+    print()
+
+    print("=" * 60)
+    print("All tests completed!")
+    print("=" * 60)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Simple test for the throttled IKC progress callback.
+"""
+import ikc
+import os
+import _ikc
+
+# Example graph with a few dozen k-core levels
+GRAPH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cit_hepph.tsv')
+
+def run_with_callback(g, min_k=0, **kwargs):
+    """Run IKC with a callback that records every (current_k, initial_k) call."""
+    calls = []
+    _ikc.run_ikc(g._graph, min_k, False, lambda current_k, initial_k: calls.append((current_k, initial_k)),
+                 **kwargs)
+    return calls
+
+def test_progress_throttling():
+    """Test that throttling drops intermediate calls but keeps the first and last."""
+    print("Testing progress callback throttling...")
+
+    g = ikc.load_graph(GRAPH_FILE)
+
+    # With a stride of one level and no interval every level is reported
+    every_level = run_with_callback(g, progress_stride=1, progress_interval_ms=0)
+    initial_k = every_level[0][0]
+    assert len(every_level) > 2, every_level
+    assert all(i == initial_k for _, i in every_level), "initial_k should not change"
+    levels = [k for k, _ in every_level]
+    assert levels == sorted(set(levels), reverse=True), "current_k should strictly decrease"
+    print(f"  ✓ Unthrottled: {len(every_level)} calls from k={initial_k} to k={levels[-1]}")
+
+    # An interval longer than the run leaves the first call, and the last
+    # level is still delivered once the run finishes
+    throttled = run_with_callback(g, progress_interval_ms=1e9)
+    assert throttled == [every_level[0], every_level[-1]], throttled
+    print(f"  ✓ Throttled: {throttled}")
+
+    # The default stride and interval report a subset ending at the same level
+    default = run_with_callback(g)
+    assert 2 <= len(default) <= len(every_level), default
+    assert set(default) <= set(every_level), default
+    assert default[0] == every_level[0] and default[-1] == every_level[-1], default
+    print(f"  ✓ Default: {len(default)} of {len(every_level)} calls")
+
+def test_progress_bar_callback():
+    """Test that the progress bar callback ends at 100%."""
+    print("Testing progress bar callback...")
+
+    class CountingBar:
+        """Stand-in for a tqdm bar that counts its refreshes."""
+        def __init__(self):
+            self.total = 1
+            self.n = 0
+            self.refreshes = 0
+
+        def set_postfix_str(self, s, refresh=True):
+            self.postfix = s
+
+        def refresh(self):
+            self.refreshes += 1
+
+    g = ikc.load_graph(GRAPH_FILE)
+    min_k = 5
+    bar = CountingBar()
+    # Report every level, so that both runs make the same calls
+    unthrottled = dict(progress_stride=1, progress_interval_ms=0)
+    calls = run_with_callback(g, min_k, **unthrottled)
+    _ikc.run_ikc(g._graph, min_k, False, ikc._make_progress_callback(bar, min_k), **unthrottled)
+
+    initial_k = calls[0][1]
+    assert bar.refreshes == len(calls), (bar.refreshes, len(calls))
+    assert bar.total == initial_k - min_k, (bar.total, initial_k)
+    assert bar.n == bar.total, (bar.n, bar.total)
+    print(f"  ✓ Bar reached {bar.n}/{bar.total} in {bar.refreshes} refreshes")
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Progress Callback Tests")
+    print("=" * 60)
+    print()
+
+    test_progress_throttling()
+    print()
+
+    test_progress_bar_callback()
+    print()
+
+    print("=" * 60)
+    print("All tests completed!")
+    print("=" * 60)
@@ -3,119 +3,147 @@
 Simple test for streaming IKC functionality.
 """
 import ikc
+import numpy as np
 import os
 import tempfile
 
+# Simple graph with a clear k-core structure
+# Triangle (nodes 0,1,2): forms a 2-core
+# Square (nodes 3,4,5,6): forms a 2-core
+# Edge connecting them: (2,3)
+TEST_EDGES = [
+    (0, 1),
+    (1, 2),
+    (2, 0),  # Triangle
+    (3, 4),
+    (4, 5),
+    (5, 6),
+    (6, 3),  # Square
+    (2, 3),  # Connection
+]
+
 def create_test_graph():
-    """Create a small test graph file."""
-    # Simple graph with a clear k-core structure
-    # Triangle (nodes 0,1,2): forms a 2-core
-    # Square (nodes 3,4,5,6): forms a 2-core
-    # Edge connecting them: (2,3)
-    edges = [
-        (0, 1),
-        (1, 2),
-        (2, 0),  # Triangle
-        (3, 4),
-        (4, 5),
-        (5, 6),
-        (6, 3),  # Square
-        (2, 3),  # Connection
-    ]
+    """Create a small in-memory test graph."""
+    return ikc.StreamingGraph.from_edges(TEST_EDGES)
 
+def write_test_graph_file(edges=TEST_EDGES):
+    """Write an edge list to a temporary TSV file and return its path."""
     fd, path = tempfile.mkstemp(suffix='.tsv', text=True)
     with os.fdopen(fd, 'w') as f:
         for u, v in edges:
             f.write(f"{u}\t{v}\n")
-
     return path
 
 def test_basic_streaming():
     """Test basic streaming operations."""
     print("Testing basic streaming IKC...")
 
-    # Create test graph
-    graph_file = create_test_graph()
+    # Initialize streaming graph
+    g = create_test_graph()
+    print(f"  Loaded graph: {g.num_nodes} nodes, {g.num_edges} edges")
 
-    try:
-        # Initialize streaming graph
-        g = ikc.StreamingGraph(graph_file)
-        print(f"  Loaded graph: {g.num_nodes} nodes, {g.num_edges} edges")
+    # Initial clustering
+    result = g.ikc(min_k=2)
+    print(f"  Initial clustering: {result.num_clusters} clusters")
 
-        # Initial clustering
-        result = g.ikc(min_k=2)
-        print(f"  Initial clustering: {result.num_clusters} clusters")
+    assert result.num_clusters > 0, "Should have at least one cluster"
+    assert g.max_core >= 2, "Should have k-core >= 2"
 
-        assert result.num_clusters > 0, "Should have at least one cluster"
-        assert g.max_core >= 2, "Should have k-core >= 2"
+    # Add edges
+    initial_clusters = result.num_clusters
+    result = g.add_edges([(0, 3), (1, 4)])  # Connect triangle and square more
+    print(f"  After adding edges: {result.num_clusters} clusters")
 
-        # Add edges
-        initial_clusters = result.num_clusters
-        result = g.add_edges([(0, 3), (1, 4)])  # Connect triangle and square more
-        print(f"  After adding edges: {result.num_clusters} clusters")
+    stats = g.last_update_stats
+    print(f"    Affected nodes: {stats['affected_nodes']}")
+    print(f"    Update time: {stats['total_time_ms']:.2f}ms")
 
-        stats = g.last_update_stats
-        print(f"    Affected nodes: {stats['affected_nodes']}")
-        print(f"    Update time: {stats['total_time_ms']:.2f}ms")
+    # Add nodes
+    result = g.add_nodes([100, 101, 102])
+    print(f"  After adding nodes: {g.num_nodes} nodes, {result.num_clusters} clusters")
 
-        # Add nodes
-        result = g.add_nodes([100, 101, 102])
-        print(f"  After adding nodes: {g.num_nodes} nodes, {result.num_clusters} clusters")
+    # Batch mode
+    g.begin_batch()
+    assert g.is_batch_mode, "Should be in batch mode"
 
-        # Batch mode
-        g.begin_batch()
-        assert g.is_batch_mode, "Should be in batch mode"
+    g.add_edges([(100, 101)])
+    g.add_edges([(101, 102)])
 
-        g.add_edges([(100, 101)])
-        g.add_edges([(101, 102)])
+    result = g.commit_batch()
+    assert not g.is_batch_mode, "Should have exited batch mode"
+    print(f"  After batch commit: {result.num_clusters} clusters")
 
-        result = g.commit_batch()
-        assert not g.is_batch_mode, "Should have exited batch mode"
-        print(f"  After batch commit: {result.num_clusters} clusters")
-
-        print("  ✓ All tests passed!")
-
-    finally:
-        # Clean up
-        os.unlink(graph_file)
+    print("  ✓ All tests passed!")
 
 def test_error_handling():
     """Test error handling."""
     print("Testing error handling...")
 
-    graph_file = create_test_graph()
+    g = create_test_graph()
+
+    # Should fail if ikc() not called
+    try:
+        g.add_edges([(0, 1)])
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError as e:
+        print(f"  ✓ Correctly raised error: {e}")
+
+    # Now initialize
+    g.ikc(min_k=2)
+
+    # This should work now
+    result = g.add_edges([(0, 1)])
+    print(f"  ✓ Edge addition works after initialization")
 
+    # Test update() with missing nodes
     try:
-        g = ikc.StreamingGraph(graph_file)
+        g.update(new_edges=[(9999, 8888)])  # Nodes don't exist
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"  ✓ Correctly raised ValueError for missing nodes: {str(e)[:80]}...")
 
-        # Should fail if ikc() not called
-        try:
-            g.add_edges([(0, 1)])
-            assert False, "Should have raised RuntimeError"
-        except RuntimeError as e:
-            print(f"  ✓ Correctly raised error: {e}")
+    # Test update() with nodes in new_nodes - should work
+    result = g.update(new_edges=[(9999, 8888)], new_nodes=[9999, 8888])
+    print(f"  ✓ Update works when all nodes are included")
 
-        # Now initialize
-        g.ikc(min_k=2)
+    # Negative or non-integer node IDs are rejected, not cast to other IDs
+    try:
+        g.add_edges([(0, -1)])
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        print(f"  ✓ Correctly raised ValueError for a negative node ID: {e}")
 
-        # This should work now
-        result = g.add_edges([(0, 1)])
-        print(f"  ✓ Edge addition works after initialization")
+    try:
+        ikc.StreamingGraph.from_edges(np.array([[0.0, 1.5]]))
+        assert False, "Should have raised TypeError"
+    except TypeError as e:
+        print(f"  ✓ Correctly raised TypeError for float node IDs: {e}")
 
-        # Test update() with missing nodes
-        try:
-            g.update(new_edges=[(9999, 8888)])  # Nodes don't exist
-            assert False, "Should have raised ValueError"
-        except ValueError as e:
-            print(f"  ✓ Correctly raised ValueError for missing nodes: {str(e)[:80]}...")
+def test_from_edges_array():
+    """Test that from_edges on a NumPy array matches loading the same edges."""
+    print("Testing from_edges on a NumPy array...")
 
-        # Test update() with nodes in new_nodes - should work
-        result = g.update(new_edges=[(9999, 8888)], new_nodes=[9999, 8888])
-        print(f"  ✓ Update works when all nodes are included")
+    edges = np.array(TEST_EDGES, dtype=np.uint64)
+    assert edges.shape == (len(TEST_EDGES), 2)
+    g = ikc.StreamingGraph.from_edges(edges)
 
+    graph_file = write_test_graph_file()
+    try:
+        loaded = ikc.load_graph(graph_file)
     finally:
         os.unlink(graph_file)
 
+    assert g.num_nodes == loaded.num_nodes, (g.num_nodes, loaded.num_nodes)
+    assert g.num_edges == loaded.num_edges, (g.num_edges, loaded.num_edges)
+    assert list(g._graph.id_map) == list(loaded._graph.id_map), "Node IDs differ"
+
+    streamed = g.ikc(min_k=2).data
+    clustered = loaded.ikc(min_k=2).data
+    assert len(streamed) == len(clustered) > 0, (len(streamed), len(clustered))
+    for name in ('node_id', 'cluster_id', 'k_value'):
+        assert np.array_equal(np.sort(streamed[name]), np.sort(clustered[name])), name
+    print(f"  ✓ from_edges matches load_graph: {g.num_nodes} nodes, {g.num_edges} edges")
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Streaming IKC Tests")
@@ -128,6 +156,9 @@ if __name__ == '__main__':
     test_error_handling()
     print()
 
+    test_from_edges_array()
+    print()
+
     print("=" * 60)
     print("All tests completed!")
     print("=" * 60)
@@ -12,9 +12,8 @@ bool is_k_valid(const std::vector<uint32_t>& component, const Graph& subgraph, u
 
     for (uint32_t node : component) {
         uint32_t degree_in_component = 0;
-        std::vector<uint32_t> neighbors = subgraph.get_neighbors(node);
-
-        for (uint32_t neighbor : neighbors) {
+        for (uint32_t e = subgraph.row_ptr[node]; e < subgraph.row_ptr[node + 1]; e++) {
+            uint32_t neighbor = subgraph.col_idx[e];
             if (component_nodes.count(neighbor)) {
                 degree_in_component++;
             }
@@ -49,8 +48,8 @@ double calculate_modularity(const std::vector<uint32_t>& component,
     size_t ls = 0;
 
     for (uint32_t node : component) {
-        std::vector<uint32_t> neighbors = orig_graph.get_neighbors(node);
-        for (uint32_t neighbor : neighbors) {
+        for (uint32_t e = orig_graph.row_ptr[node]; e < orig_graph.row_ptr[node + 1]; e++) {
+            uint32_t neighbor = orig_graph.col_idx[e];
             if (component_set.count(neighbor) && node < neighbor) {
                 ls++;
             }
@@ -29,8 +29,8 @@ std::vector<std::vector<uint32_t>> find_connected_components(const Graph& graph)
             queue.pop();
             component.push_back(node);
 
-            std::vector<uint32_t> neighbors = graph.get_neighbors(node);
-            for (uint32_t neighbor : neighbors) {
+            for (uint32_t e = graph.row_ptr[node]; e < graph.row_ptr[node + 1]; e++) {
+                uint32_t neighbor = graph.col_idx[e];
                 if (!visited[neighbor]) {
                     visited[neighbor] = true;
                     queue.push(neighbor);
@@ -51,17 +51,22 @@ Graph remove_nodes_and_compact(const Graph& graph,
     return new_graph;
 }
 
-// Main iterative k-core decomposition algorithm with modularity checking and early stopping
+// Main iterative k-core decomposition algorithm with modularity checking and early stopping.
+// initial_kcore, if given, is the decomposition of `graph` and is used for the first round.
 std::vector<Cluster> iterative_kcore_decomposition(Graph graph,
                                                    uint32_t min_k,
                                                    const Graph& orig_graph,
                                                    bool verbose = false,
-                                                   std::function<void(uint32_t)> progress_callback = nullptr) {
+                                                   std::function<void(uint32_t)> progress_callback = nullptr,
+                                                   int num_threads = 0,
+                                                   const KCoreResult* initial_kcore = nullptr) {
     std::vector<Cluster> final_clusters;
     std::vector<uint64_t> singletons;
 
-    // Initialize node ID mapping (maps current graph node IDs to original node IDs)
-    std::vector<uint64_t> orig_node_ids = orig_graph.id_map;
+    // Initialize node ID mapping (maps current graph node IDs to original node IDs).
+    // This is graph's own id_map, which differs from orig_graph's when only a
+    // subgraph is clustered.
+    std::vector<uint64_t> orig_node_ids = graph.id_map;
 
     size_t nbr_failed_modularity = 0;
     size_t nbr_failed_k_valid = 0;
@@ -80,8 +85,11 @@ std::vector<Cluster> iterative_kcore_decomposition(Graph graph,
 
     // Continue finding clusters until no nodes left or max_k < min_k
     while (graph.num_nodes > 0) {
-        // Compute k-core decomposition
-        KCoreResult kcore = compute_kcore_decomposition(graph);
+        // Compute k-core decomposition; the first round can reuse one that
+        // was computed beforehand for the full graph
+        KCoreResult kcore = (first_iteration && initial_kcore)
+            ? *initial_kcore
+            : compute_kcore_decomposition(graph, num_threads);
         uint32_t max_k = kcore.max_core;
 
         // Track initial max_k on first iteration
@@ -5,7 +5,9 @@
 #include <queue>
 #include <set>
 #include <algorithm>
+#include <limits>
 #include <unordered_set>
+#include <omp.h>
 #include "../data_structures/graph.h"
 
 // K-core decomposition result
@@ -16,56 +18,243 @@ struct KCoreResult {
     KCoreResult(size_t num_nodes) : core_numbers(num_nodes, 0), max_core(0) {}
 };
 
-// Compute k-core decomposition using the peeling algorithm
-KCoreResult compute_kcore_decomposition(const Graph& graph) {
+// Compute k-core decomposition using the sequential bin-based peeling
+// algorithm of Batagelj and Zaversnik. Nodes are kept in flat arrays sorted
+// by residual degree: vert holds the nodes in order, pos is each node's index
+// in vert, and bin_start is where each degree's bin begins. Decrementing a
+// neighbour swaps it to the front of its bin and moves the bin boundary, so
+// the peel touches a few flat arrays only. Nodes before the cursor are the
+// peeled ones, so no separate removed flags are needed.
+KCoreResult compute_kcore_decomposition_sequential(const Graph& graph) {
     KCoreResult result(graph.num_nodes);
+    const uint32_t n = graph.num_nodes;
 
-    if (graph.num_nodes == 0) return result;
+    if (n == 0) return result;
 
-    // Initialize degrees and core numbers
-    std::vector<uint32_t> degrees(graph.num_nodes);
-    std::vector<bool> removed(graph.num_nodes, false);
-
-    for (uint32_t i = 0; i < graph.num_nodes; i++) {
+    // Residual degrees; they end up as the core numbers
+    std::vector<uint32_t>& degrees = result.core_numbers;
+    uint32_t max_degree = 0;
+    for (uint32_t i = 0; i < n; i++) {
         degrees[i] = graph.get_degree(i);
+        max_degree = std::max(max_degree, degrees[i]);
     }
 
-    // Create degree bins for efficient peeling
-    uint32_t max_degree = *std::max_element(degrees.begin(), degrees.end());
-    std::vector<std::vector<uint32_t>> bins(max_degree + 1);
+    // Bucket-sort the nodes by degree
+    std::vector<uint32_t> bin_start(max_degree + 2, 0);
+    for (uint32_t i = 0; i < n; i++) {
+        bin_start[degrees[i] + 1]++;
+    }
+    for (uint32_t d = 0; d <= max_degree; d++) {
+        bin_start[d + 1] += bin_start[d];
+    }
 
-    for (uint32_t i = 0; i < graph.num_nodes; i++) {
-        bins[degrees[i]].push_back(i);
+    std::vector<uint32_t> vert(n);
+    std::vector<uint32_t> pos(n);
+    {
+        std::vector<uint32_t> next(bin_start.begin(), bin_start.end() - 1);
+        for (uint32_t i = 0; i < n; i++) {
+            pos[i] = next[degrees[i]]++;
+            vert[pos[i]] = i;
+        }
     }
 
     // Peel nodes in order of degree
-    uint32_t current_core = 0;
-    for (uint32_t bin_idx = 0; bin_idx <= max_degree; bin_idx++) {
-        while (!bins[bin_idx].empty()) {
-            uint32_t node = bins[bin_idx].back();
-            bins[bin_idx].pop_back();
-
-            if (removed[node]) continue;
-
-            result.core_numbers[node] = bin_idx;
-            current_core = std::max(current_core, bin_idx);
-            removed[node] = true;
-
-            // Update neighbors' degrees
-            std::vector<uint32_t> neighbors = graph.get_neighbors(node);
-            for (uint32_t neighbor : neighbors) {
-                if (!removed[neighbor] && degrees[neighbor] > bin_idx) {
-                    degrees[neighbor]--;
-                    bins[degrees[neighbor]].push_back(neighbor);
+    for (uint32_t i = 0; i < n; i++) {
+        uint32_t node = vert[i];
+        uint32_t node_degree = degrees[node];
+
+        // Update neighbors' degrees
+        for (uint32_t e = graph.row_ptr[node]; e < graph.row_ptr[node + 1]; e++) {
+            uint32_t neighbor = graph.col_idx[e];
+            uint32_t degree = degrees[neighbor];
+            if (degree <= node_degree) continue;
+
+            // Swap the neighbour with the first node of its bin, then
+            // shrink the bin past it so it falls into the bin below
+            uint32_t first_pos = bin_start[degree];
+            uint32_t first = vert[first_pos];
+            if (first != neighbor) {
+                vert[pos[neighbor]] = first;
+                pos[first] = pos[neighbor];
+                vert[first_pos] = neighbor;
+                pos[neighbor] = first_pos;
+            }
+            bin_start[degree]++;
+            degrees[neighbor]--;
+        }
+    }
+
+    result.max_core = *std::max_element(degrees.begin(), degrees.end());
+    return result;
+}
+
+// Compute k-core decomposition with level-synchronous parallel peeling
+// (ParK/PKC). For each level k, nodes whose residual degree is exactly k are
+// collected in parallel and peeled; each peel decrements the residual degree
+// of every neighbour still above k, through per-thread buffers that the
+// owner of the neighbour's id range applies. A neighbour that drops to k
+// joins the same level, and further decrements to it are dropped. When
+// peeling finishes, each node's residual degree equals its core number.
+// Nodes are appended to a single queue in peel order, each exactly once, so
+// every frontier is a contiguous slice of it. Threads collect nodes in local
+// buffers and reserve queue space with one atomic add per buffer. Levels no
+// node is left at are skipped: the next level is the smallest residual
+// degree still above k, tracked with a min-reduction over the scan and the
+// decrements, so there is one scan per distinct core number.
+//
+// Degree is the type residual degrees are stored in. The dispatcher below
+// picks it from the graph's max degree: uint8_t up to 255, uint16_t up to
+// 65535, uint32_t otherwise.
+template <typename Degree>
+KCoreResult compute_kcore_decomposition_parallel_impl(const Graph& graph, int num_threads) {
+    KCoreResult result(graph.num_nodes);
+    const size_t n = graph.num_nodes;
+
+    if (n == 0) return result;
+
+    std::vector<Degree> degrees(n);
+    std::vector<uint32_t> queue(n);
+    size_t head = 0;
+    size_t tail = 0;
+
+    // decrements[t][r]: neighbours peeled by thread t whose ids fall in the
+    // range owned by thread r
+    std::vector<std::vector<std::vector<uint32_t>>> decrements(
+        num_threads, std::vector<std::vector<uint32_t>>(num_threads));
+
+    #pragma omp parallel for num_threads(num_threads) schedule(static)
+    for (size_t i = 0; i < n; i++) {
+        degrees[i] = static_cast<Degree>(graph.get_degree(i));
+    }
+
+    // Append a thread-local buffer to the queue
+    auto flush = [&](std::vector<uint32_t>& local) {
+        if (local.empty()) return;
+        size_t pos;
+        #pragma omp atomic capture
+        { pos = tail; tail += local.size(); }
+        std::copy(local.begin(), local.end(), queue.begin() + pos);
+        local.clear();
+    };
+
+    uint32_t level = 0;
+    while (head < n) {
+        // Smallest residual degree above this level once it is peeled
+        uint32_t next_level = std::numeric_limits<uint32_t>::max();
+
+        // Scan: nodes whose residual degree is exactly the current level
+        #pragma omp parallel num_threads(num_threads)
+        {
+            std::vector<uint32_t> local;
+            #pragma omp for schedule(static) nowait reduction(min:next_level)
+            for (size_t i = 0; i < n; i++) {
+                uint32_t degree = degrees[i];
+                if (degree == level) {
+                    local.push_back(i);
+                } else if (degree > level) {
+                    next_level = std::min(next_level, degree);
+                }
+            }
+            flush(local);
+        }
+
+        // Peel the frontier until no more nodes drop to this level. Each
+        // round first scatters the decrements into per-thread buffers,
+        // bucketed by the thread that owns the neighbour's id range, then
+        // every thread applies the decrements for its own range. Each
+        // degree has a single writer, so hubs see no contended atomics.
+        while (head < tail) {
+            const size_t begin = head;
+            const size_t end = tail;
+            head = end;
+
+            #pragma omp parallel num_threads(num_threads) reduction(min:next_level)
+            {
+                const int thread_id = omp_get_thread_num();
+                const size_t team_size = static_cast<size_t>(omp_get_num_threads());
+                const size_t range_size = (n + team_size - 1) / team_size;
+
+                std::vector<std::vector<uint32_t>>& outgoing = decrements[thread_id];
+                for (size_t t = 0; t < team_size; t++) {
+                    outgoing[t].clear();
+                }
+
+                #pragma omp for schedule(dynamic, 64)
+                for (size_t i = begin; i < end; i++) {
+                    uint32_t node = queue[i];
+                    for (uint32_t e = graph.row_ptr[node]; e < graph.row_ptr[node + 1]; e++) {
+                        uint32_t neighbor = graph.col_idx[e];
+                        if (degrees[neighbor] > level) {
+                            outgoing[neighbor / range_size].push_back(neighbor);
+                        }
+                    }
+                }
+                // Implicit barrier: all decrements are buffered
+
+                std::vector<uint32_t> local;
+                for (size_t t = 0; t < team_size; t++) {
+                    for (uint32_t neighbor : decrements[t][thread_id]) {
+                        if (degrees[neighbor] <= level) continue;
+                        uint32_t degree = --degrees[neighbor];
+                        if (degree == level) {
+                            local.push_back(neighbor);
+                        } else {
+                            next_level = std::min(next_level, degree);
+                        }
+                    }
                 }
+                flush(local);
             }
         }
+        level = next_level;
     }
 
-    result.max_core = current_core;
+    uint32_t max_core = 0;
+    #pragma omp parallel for num_threads(num_threads) reduction(max:max_core) schedule(static)
+    for (size_t i = 0; i < n; i++) {
+        result.core_numbers[i] = degrees[i];
+        max_core = std::max(max_core, result.core_numbers[i]);
+    }
+    result.max_core = max_core;
     return result;
 }
 
+// Run the parallel peel with the narrowest residual degree type that holds
+// the largest degree; the peel streams over the degree array once per
+// level, so a smaller type means proportionally less memory traffic
+KCoreResult compute_kcore_decomposition_parallel(const Graph& graph, int num_threads) {
+    uint32_t max_degree = 0;
+    #pragma omp parallel for num_threads(num_threads) reduction(max:max_degree) schedule(static)
+    for (size_t i = 0; i < graph.num_nodes; i++) {
+        max_degree = std::max(max_degree, graph.get_degree(i));
+    }
+
+    if (max_degree <= std::numeric_limits<uint8_t>::max()) {
+        return compute_kcore_decomposition_parallel_impl<uint8_t>(graph, num_threads);
+    }
+    if (max_degree <= std::numeric_limits<uint16_t>::max()) {
+        return compute_kcore_decomposition_parallel_impl<uint16_t>(graph, num_threads);
+    }
+    return compute_kcore_decomposition_parallel_impl<uint32_t>(graph, num_threads);
+}
+
+// Graphs smaller than this are decomposed sequentially; below it the
+// per-level scans and thread start-up cost more than parallelism saves
+constexpr size_t PARALLEL_KCORE_MIN_NODES = 50000;
+
+// Compute k-core decomposition. num_threads <= 0 uses the OpenMP default;
+// the parallel algorithm is used for large graphs when more than one thread
+// is available. Both produce the same core numbers.
+KCoreResult compute_kcore_decomposition(const Graph& graph, int num_threads = 0) {
+    if (num_threads <= 0) {
+        num_threads = omp_get_max_threads();
+    }
+    if (num_threads == 1 || graph.num_nodes < PARALLEL_KCORE_MIN_NODES) {
+        return compute_kcore_decomposition_sequential(graph);
+    }
+    return compute_kcore_decomposition_parallel(graph, num_threads);
+}
+
 // Get nodes in k-core (nodes with core number >= k)
 std::vector<uint32_t> get_kcore_nodes(const KCoreResult& kcore, uint32_t k) {
     std::vector<uint32_t> kcore_nodes;
@@ -83,8 +272,9 @@ Graph create_subgraph(const Graph& graph, const std::vector<uint32_t>& nodes) {
 
     if (nodes.empty()) return subgraph;
 
-    // Create node mapping
-    std::unordered_map<uint32_t, uint32_t> old_to_new;
+    // Create node mapping; a dense array indexed by the old id, with
+    // UINT32_MAX for nodes outside the subgraph
+    std::vector<uint32_t> old_to_new(graph.num_nodes, UINT32_MAX);
     subgraph.num_nodes = nodes.size();
     subgraph.id_map.resize(nodes.size());
     subgraph.row_ptr.resize(nodes.size() + 1);
@@ -99,10 +289,9 @@ Graph create_subgraph(const Graph& graph, const std::vector<uint32_t>& nodes) {
     std::vector<uint32_t> edge_counts(nodes.size(), 0);
     for (size_t i = 0; i < nodes.size(); i++) {
         uint32_t old_node = nodes[i];
-        std::vector<uint32_t> neighbors = graph.get_neighbors(old_node);
-
-        for (uint32_t neighbor : neighbors) {
-            if (old_to_new.count(neighbor)) {
+        for (uint32_t e = graph.row_ptr[old_node]; e < graph.row_ptr[old_node + 1]; e++) {
+            uint32_t neighbor = graph.col_idx[e];
+            if (old_to_new[neighbor] != UINT32_MAX) {
                 edge_counts[i]++;
             }
         }
@@ -120,10 +309,9 @@ Graph create_subgraph(const Graph& graph, const std::vector<uint32_t>& nodes) {
 
     for (size_t i = 0; i < nodes.size(); i++) {
         uint32_t old_node = nodes[i];
-        std::vector<uint32_t> neighbors = graph.get_neighbors(old_node);
-
-        for (uint32_t neighbor : neighbors) {
-            if (old_to_new.count(neighbor)) {
+        for (uint32_t e = graph.row_ptr[old_node]; e < graph.row_ptr[old_node + 1]; e++) {
+            uint32_t neighbor = graph.col_idx[e];
+            if (old_to_new[neighbor] != UINT32_MAX) {
                 subgraph.col_idx[current_pos[i]++] = old_to_new[neighbor];
             }
         }
@@ -0,0 +1,157 @@
+#ifndef KCORE_COMPONENT_SEARCH_H
+#define KCORE_COMPONENT_SEARCH_H
+
+#include <vector>
+#include "../data_structures/graph.h"
+#include "kcore.h"
+
+namespace ikc {
+
+/**
+ * Result structure for the smallest k-core component search
+ */
+struct KCoreComponentResult {
+    std::vector<uint64_t> nodes;        // Nodes in the component
+    uint32_t k_value;                   // The requested k
+    size_t size;                        // Size of the component
+    bool found;                         // Whether the k-core is non-empty
+
+    KCoreComponentResult() : k_value(0), size(0), found(false) {}
+};
+
+/**
+ * Find the smallest connected component of a graph's k-core with
+ * pre-computed core numbers
+ *
+ * The k-core is the subgraph induced by the nodes with core number >= k.
+ * Each of its connected components is a connected subgraph with minimum
+ * degree >= k; this returns the one with the fewest nodes. It is not
+ * necessarily the smallest connected subgraph with minimum degree >= k:
+ * a component can contain a smaller one (finding that is NP-hard). Since it
+ * only thresholds the core numbers, any number of k values can be queried
+ * against one k-core decomposition.
+ *
+ * Algorithm:
+ * 1. Mark all nodes with core number >= k
+ * 2. Find the connected components of the marked nodes by BFS
+ * 3. Keep the smallest component (stopping early at k + 1 nodes, the fewest
+ *    any component can have)
+ *
+ * Time complexity: O(n + m)
+ *
+ * @param graph The input graph
+ * @param k The minimum degree of the k-core
+ * @param core_numbers Pre-computed core numbers (from k-core decomposition)
+ * @return KCoreComponentResult containing the smallest component (found=false
+ *         if the k-core is empty, or if core_numbers doesn't have one entry
+ *         per node; the Python bindings reject the latter with ValueError)
+ */
+KCoreComponentResult find_smallest_kcore_component_internal(
+    const Graph& graph,
+    uint32_t k,
+    const std::vector<uint32_t>& core_numbers
+) {
+    KCoreComponentResult result;
+    result.k_value = k;
+
+    if (core_numbers.size() != graph.num_nodes) {
+        return result;  // Core numbers don't belong to this graph
+    }
+
+    const uint32_t n = static_cast<uint32_t>(core_numbers.size());
+    std::vector<bool> visited(n, false);
+    std::vector<uint32_t> component;
+    std::vector<uint32_t> best;
+    bool have_best = false;
+
+    for (uint32_t start = 0; start < n; ++start) {
+        if (visited[start] || core_numbers[start] < k) continue;
+
+        // BFS over the k-core, using the component itself as the queue
+        component.clear();
+        component.push_back(start);
+        visited[start] = true;
+        for (size_t head = 0; head < component.size(); ++head) {
+            uint32_t current = component[head];
+            for (uint32_t e = graph.row_ptr[current]; e < graph.row_ptr[current + 1]; e++) {
+                uint32_t neighbor = graph.col_idx[e];
+                if (!visited[neighbor] && core_numbers[neighbor] >= k) {
+                    visited[neighbor] = true;
+                    component.push_back(neighbor);
+                }
+            }
+        }
+
+        if (!have_best || component.size() < best.size()) {
+            best.swap(component);
+            have_best = true;
+            if (best.size() == static_cast<size_t>(k) + 1) {
+                break;  // A (k + 1)-clique; no component is smaller
+            }
+        }
+    }
+
+    if (!have_best) {
+        return result;  // Empty k-core
+    }
+
+    // Map to original node IDs
+    result.nodes.reserve(best.size());
+    for (uint32_t internal_id : best) {
+        result.nodes.push_back(graph.id_map[internal_id]);
+    }
+    result.size = result.nodes.size();
+    result.found = true;
+
+    return result;
+}
+
+/**
+ * Find the smallest connected component of a graph's k-core
+ *
+ * @param graph The input graph
+ * @param k The minimum degree of the k-core
+ * @return KCoreComponentResult containing the smallest component
+ *
+ * Example:
+ *   auto result = find_smallest_kcore_component(graph, 10);
+ *   if (result.found) {
+ *       cout << "Smallest 10-core component has " << result.size << " nodes" << endl;
+ *   }
+ */
+KCoreComponentResult find_smallest_kcore_component(
+    const Graph& graph,
+    uint32_t k
+) {
+    // Compute k-core decomposition
+    auto kcore_result = compute_kcore_decomposition(graph);
+    return find_smallest_kcore_component_internal(graph, k, kcore_result.core_numbers);
+}
+
+/**
+ * Overload: Find the smallest k-core component with cached core numbers
+ *
+ * Use this version when you've already computed k-core decomposition to avoid
+ * redundant computation, e.g. when querying several k values.
+ *
+ * @param graph The input graph
+ * @param k The minimum degree of the k-core
+ * @param core_numbers Pre-computed core numbers (from k-core decomposition)
+ * @return KCoreComponentResult containing the smallest component
+ *
+ * Example:
+ *   auto kcore = compute_kcore_decomposition(graph);
+ *   auto result5 = find_smallest_kcore_component(graph, 5, kcore.core_numbers);
+ *   auto result10 = find_smallest_kcore_component(graph, 10, kcore.core_numbers);
+ */
+KCoreComponentResult find_smallest_kcore_component(
+    const Graph& graph,
+    uint32_t k,
+    const std::vector<uint32_t>& core_numbers
+) {
+    return find_smallest_kcore_component_internal(graph, k, core_numbers);
+}
+
+} // namespace ikc
+
+#endif // KCORE_COMPONENT_SEARCH_H
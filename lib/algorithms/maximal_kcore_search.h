@@ -2,8 +2,6 @@
 #define MAXIMAL_KCORE_SEARCH_H
 
 #include <vector>
-#include <unordered_set>
-#include <queue>
 #include <algorithm>
 #include "../data_structures/graph.h"
 #include "kcore.h"
@@ -32,24 +30,33 @@ struct MaximalKCoreResult {
  *
  * Algorithm:
  * 1. Get the core number of query node (this is the maximal k)
- * 2. Extract all nodes with core number >= k
- * 3. Find the connected component containing the query node
+ * 2. BFS from the query node through nodes with core number >= k (these
+ *    form the k-core), reading the core numbers directly
+ * 3. The nodes reached are the connected component containing the query node
  *
- * Time complexity: O(n + m) for BFS to find connected component
+ * Time complexity: O(size of the component and its edges)
  *
  * @param graph The input graph
  * @param query_node The node whose maximal k-core we want to find
  * @param core_numbers Pre-computed core numbers (from k-core decomposition)
- * @return MaximalKCoreResult containing the maximal k-core
+ * @param visited Scratch space of core_numbers.size() flags, all false; they
+ *                are reset before returning, so it can be reused across queries
+ * @return MaximalKCoreResult containing the maximal k-core (found=false if the
+ *         query node or the core numbers don't belong to the graph)
  */
 MaximalKCoreResult find_maximal_kcore_internal(
     const Graph& graph,
     uint64_t query_node,
-    const std::vector<uint32_t>& core_numbers
+    const std::vector<uint32_t>& core_numbers,
+    std::vector<bool>& visited
 ) {
     MaximalKCoreResult result;
     result.found = false;
 
+    if (core_numbers.size() != graph.num_nodes) {
+        return result;  // Core numbers don't belong to this graph
+    }
+
     // Check if query_node is valid
     if (query_node >= core_numbers.size()) {
         return result;  // Node doesn't exist
@@ -68,55 +75,51 @@ MaximalKCoreResult find_maximal_kcore_internal(
         return result;
     }
 
-    // Extract all nodes with core number >= k (these form the k-core)
-    std::unordered_set<uint64_t> kcore_nodes;
-    for (uint64_t i = 0; i < core_numbers.size(); ++i) {
-        if (core_numbers[i] >= k) {
-            kcore_nodes.insert(i);
-        }
-    }
-
     // Find connected component containing query_node within the k-core
-    // Using BFS
-    std::unordered_set<uint64_t> visited;
-    std::queue<uint64_t> queue;
-    std::vector<uint64_t> component;
-
-    queue.push(query_node);
-    visited.insert(query_node);
+    // using BFS, with the component itself as the queue
+    std::vector<uint32_t> component;
+    component.push_back(static_cast<uint32_t>(query_node));
+    visited[query_node] = true;
 
-    while (!queue.empty()) {
-        uint64_t current = queue.front();
-        queue.pop();
-        component.push_back(current);
+    for (size_t head = 0; head < component.size(); ++head) {
+        uint32_t current = component[head];
 
         // Visit neighbors that are in the k-core
-        const auto& neighbors = graph.get_neighbors(current);
-        for (uint64_t neighbor : neighbors) {
-            if (kcore_nodes.count(neighbor) && !visited.count(neighbor)) {
-                visited.insert(neighbor);
-                queue.push(neighbor);
+        for (uint32_t e = graph.row_ptr[current]; e < graph.row_ptr[current + 1]; e++) {
+            uint32_t neighbor = graph.col_idx[e];
+            if (core_numbers[neighbor] >= k && !visited[neighbor]) {
+                visited[neighbor] = true;
+                component.push_back(neighbor);
             }
         }
     }
 
-    // Map to original node IDs
-    std::vector<uint64_t> original_ids;
-    for (uint64_t internal_id : component) {
+    // Map to original node IDs, resetting the scratch flags on the way
+    result.nodes.reserve(component.size());
+    for (uint32_t internal_id : component) {
+        visited[internal_id] = false;
         if (internal_id < graph.id_map.size()) {
-            original_ids.push_back(graph.id_map[internal_id]);
+            result.nodes.push_back(graph.id_map[internal_id]);
         } else {
-            original_ids.push_back(internal_id);
+            result.nodes.push_back(internal_id);
         }
     }
 
-    result.nodes = original_ids;
-    result.size = original_ids.size();
+    result.size = result.nodes.size();
     result.found = true;
 
     return result;
 }
 
+MaximalKCoreResult find_maximal_kcore_internal(
+    const Graph& graph,
+    uint64_t query_node,
+    const std::vector<uint32_t>& core_numbers
+) {
+    std::vector<bool> visited(core_numbers.size(), false);
+    return find_maximal_kcore_internal(graph, query_node, core_numbers, visited);
+}
+
 /**
  * Find the maximal k-core containing a query node
  *
@@ -167,6 +170,38 @@ MaximalKCoreResult find_maximal_kcore(
     return find_maximal_kcore_internal(graph, query_node, core_numbers);
 }
 
+/**
+ * Find the maximal k-cores of several query nodes with cached core numbers
+ *
+ * The searches are independent, so they run in parallel over the shared,
+ * read-only graph and core numbers, each thread with its own scratch flags.
+ * The caller crosses into C++ once for the whole batch.
+ *
+ * @param graph The input graph
+ * @param query_nodes The nodes whose maximal k-cores we want to find
+ * @param core_numbers Pre-computed core numbers (from k-core decomposition)
+ * @return One MaximalKCoreResult per query node, in query order
+ */
+std::vector<MaximalKCoreResult> find_maximal_kcores(
+    const Graph& graph,
+    const std::vector<uint64_t>& query_nodes,
+    const std::vector<uint32_t>& core_numbers
+) {
+    std::vector<MaximalKCoreResult> results(query_nodes.size());
+
+    #pragma omp parallel if(query_nodes.size() > 1)
+    {
+        std::vector<bool> visited(core_numbers.size(), false);
+
+        #pragma omp for schedule(dynamic, 1)
+        for (size_t i = 0; i < query_nodes.size(); i++) {
+            results[i] = find_maximal_kcore_internal(graph, query_nodes[i], core_numbers, visited);
+        }
+    }
+
+    return results;
+}
+
 } // namespace ikc
 
 #endif // MAXIMAL_KCORE_SEARCH_H
@@ -45,8 +45,18 @@ private:
     std::vector<uint64_t> pending_nodes_;            // Pending nodes in batch mode
 
     /**
-     * Update core numbers incrementally after adding edges
-     * Based on Sariyüce et al. (2013) algorithm
+     * Update core numbers incrementally after adding edges, using the subcore
+     * traversal of Sariyüce et al. (2013). Inserting (u, v) raises core
+     * numbers by at most one, and only for nodes with core K = min(core[u],
+     * core[v]) that are connected to the lower endpoint through nodes of core
+     * K (its subcore). Subcore nodes with at most K neighbours of core >= K
+     * are evicted repeatedly; the nodes that remain move to core K + 1.
+     *
+     * Edges are applied one at a time. graph_ already contains the whole batch,
+     * so edges later in the batch are ignored until their turn.
+     *
+     * @param new_edges Edges added to graph_ that were not in it before, each once
+     * @return Nodes whose core number changed
      */
     std::unordered_set<uint32_t> update_core_numbers_incremental(
         const std::vector<std::pair<uint32_t, uint32_t>>& new_edges) {
@@ -57,66 +67,91 @@ private:
             return affected_nodes;
         }
 
-        // Find the minimum k value among endpoints of new edges
-        uint32_t k_max = 0;
+        auto edge_key = [](uint32_t a, uint32_t b) {
+            if (a > b) std::swap(a, b);
+            return (static_cast<uint64_t>(a) << 32) | b;
+        };
+
+        // New edges not applied yet
+        std::unordered_set<uint64_t> pending;
         for (const auto& [u, v] : new_edges) {
-            k_max = std::max(k_max, std::max(core_numbers_[u], core_numbers_[v]));
+            pending.insert(edge_key(u, v));
         }
+        auto is_applied = [&](uint32_t a, uint32_t b) {
+            return pending.empty() || !pending.count(edge_key(a, b));
+        };
+
+        // Per-node scratch state, reset for every traversal
+        enum : uint8_t { UNSEEN = 0, IN_SUBCORE = 1, EVICTED = 2 };
+        std::vector<uint8_t> state(graph_.num_nodes, UNSEEN);
+        std::vector<uint32_t> support(graph_.num_nodes, 0);
+        std::vector<uint32_t> subcore;
+        std::vector<uint32_t> stack;
+        std::vector<uint32_t> evicted;
 
-        // Candidates: nodes that could be promoted
-        std::unordered_set<uint32_t> candidates;
         for (const auto& [u, v] : new_edges) {
-            if (core_numbers_[u] >= k_max) {
-                candidates.insert(u);
-            }
-            if (core_numbers_[v] >= k_max) {
-                candidates.insert(v);
+            pending.erase(edge_key(u, v));
+
+            uint32_t root = core_numbers_[u] <= core_numbers_[v] ? u : v;
+            uint32_t k = core_numbers_[root];
+
+            // Collect the subcore of root
+            subcore.clear();
+            stack.assign(1, root);
+            state[root] = IN_SUBCORE;
+            while (!stack.empty()) {
+                uint32_t w = stack.back();
+                stack.pop_back();
+                subcore.push_back(w);
+
+                for (uint32_t i = graph_.row_ptr[w]; i < graph_.row_ptr[w + 1]; ++i) {
+                    uint32_t x = graph_.col_idx[i];
+                    if (core_numbers_[x] == k && state[x] == UNSEEN && is_applied(w, x)) {
+                        state[x] = IN_SUBCORE;
+                        stack.push_back(x);
+                    }
+                }
             }
-        }
 
-        // Priority queue: process nodes by increasing core number
-        using PQElement = std::pair<uint32_t, uint32_t>; // (core_number, node)
-        std::priority_queue<PQElement, std::vector<PQElement>, std::greater<PQElement>> pq;
-
-        for (uint32_t node : candidates) {
-            pq.push({core_numbers_[node], node});
-        }
-
-        std::unordered_set<uint32_t> visited;
-
-        while (!pq.empty()) {
-            auto [k_current, v] = pq.top();
-            pq.pop();
-
-            if (visited.count(v)) {
-                continue;
+            // Support: neighbours that could be in the (k + 1)-core
+            evicted.clear();
+            for (uint32_t w : subcore) {
+                uint32_t count = 0;
+                for (uint32_t i = graph_.row_ptr[w]; i < graph_.row_ptr[w + 1]; ++i) {
+                    uint32_t x = graph_.col_idx[i];
+                    if (core_numbers_[x] >= k && is_applied(w, x)) {
+                        count++;
+                    }
+                }
+                support[w] = count;
+                if (count <= k) {
+                    state[w] = EVICTED;
+                    evicted.push_back(w);
+                }
             }
-            visited.insert(v);
 
-            // Check if v should be promoted
-            // Count neighbors in (k_current + 1)-core or higher
-            uint32_t neighbors_in_higher_core = 0;
-            std::vector<uint32_t> neighbors = graph_.get_neighbors(v);
+            // Evicting a node removes one unit of support from its subcore neighbours
+            while (!evicted.empty()) {
+                uint32_t w = evicted.back();
+                evicted.pop_back();
 
-            for (uint32_t w : neighbors) {
-                if (core_numbers_[w] >= k_current + 1) {
-                    neighbors_in_higher_core++;
+                for (uint32_t i = graph_.row_ptr[w]; i < graph_.row_ptr[w + 1]; ++i) {
+                    uint32_t x = graph_.col_idx[i];
+                    if (state[x] == IN_SUBCORE && is_applied(w, x) && --support[x] == k) {
+                        state[x] = EVICTED;
+                        evicted.push_back(x);
+                    }
                 }
             }
 
-            // Promotion condition: degree in (k+1)-core >= k+1
-            if (neighbors_in_higher_core >= k_current + 1) {
-                // Promote v to next k-core
-                core_numbers_[v] = k_current + 1;
-                affected_nodes.insert(v);
-                max_core_ = std::max(max_core_, core_numbers_[v]);
-
-                // Neighbors at k_current might also be promotable
-                for (uint32_t w : neighbors) {
-                    if (core_numbers_[w] == k_current && !visited.count(w)) {
-                        pq.push({core_numbers_[w], w});
-                    }
+            // Promote the survivors
+            for (uint32_t w : subcore) {
+                if (state[w] == IN_SUBCORE) {
+                    core_numbers_[w] = k + 1;
+                    affected_nodes.insert(w);
+                    max_core_ = std::max(max_core_, k + 1);
                 }
+                state[w] = UNSEEN;
             }
         }
 
@@ -124,7 +159,20 @@ private:
     }
 
     /**
-     * Detect which clusters are invalidated by affected nodes
+     * Check whether an edge is already in graph_ by scanning the shorter row
+     */
+    bool has_edge(uint32_t u, uint32_t v) const {
+        if (graph_.get_degree(u) > graph_.get_degree(v)) std::swap(u, v);
+        for (uint32_t i = graph_.row_ptr[u]; i < graph_.row_ptr[u + 1]; ++i) {
+            if (graph_.col_idx[i] == v) return true;
+        }
+        return false;
+    }
+
+    /**
+     * Detect which clusters are invalidated by affected nodes. Only the
+     * clusters that affected nodes are assigned to (via cluster_assignment_)
+     * are checked; every other cluster is kept as is.
      */
     void detect_invalid_clusters(
         const std::unordered_set<uint32_t>& affected_nodes,
@@ -136,50 +184,40 @@ private:
         invalid_cluster_indices.clear();
         nodes_to_recompute.clear();
 
-        for (size_t cluster_idx = 0; cluster_idx < clusters_.size(); ++cluster_idx) {
-            const Cluster& cluster = clusters_[cluster_idx];
-
-            // Check if cluster has any affected nodes
-            bool has_affected = false;
-            for (uint64_t orig_node_id : cluster.nodes) {
-                // Convert original node ID to internal ID
-                if (graph_.node_map.count(orig_node_id)) {
-                    uint32_t internal_id = graph_.node_map.at(orig_node_id);
-                    if (affected_nodes.count(internal_id)) {
-                        has_affected = true;
-                        break;
-                    }
-                }
+        // Clusters containing at least one affected node
+        std::vector<bool> has_affected(clusters_.size(), false);
+        for (uint32_t node : affected_nodes) {
+            uint32_t cluster_idx = cluster_assignment_[node];
+            if (cluster_idx != UINT32_MAX) {
+                has_affected[cluster_idx] = true;
             }
+        }
+
+        // Internal ids of the cluster being checked
+        std::vector<uint32_t> members;
 
-            if (!has_affected) {
+        for (size_t cluster_idx = 0; cluster_idx < clusters_.size(); ++cluster_idx) {
+            if (!has_affected[cluster_idx]) {
                 // Cluster completely unaffected
                 valid_cluster_indices.push_back(cluster_idx);
                 continue;
             }
 
+            const Cluster& cluster = clusters_[cluster_idx];
+            members.clear();
+            for (uint64_t orig_node_id : cluster.nodes) {
+                members.push_back(graph_.node_map.at(orig_node_id));
+            }
+
             // Cluster has affected nodes - check if still k-valid
             uint32_t k = cluster.k_value;
             bool k_valid = true;
 
-            std::unordered_set<uint64_t> cluster_node_set(cluster.nodes.begin(),
-                                                           cluster.nodes.end());
-
-            for (uint64_t orig_node_id : cluster.nodes) {
-                if (!graph_.node_map.count(orig_node_id)) {
-                    k_valid = false;
-                    break;
-                }
-
-                uint32_t internal_id = graph_.node_map.at(orig_node_id);
-
+            for (uint32_t internal_id : members) {
                 // Count internal degree
                 uint32_t internal_degree = 0;
-                std::vector<uint32_t> neighbors = graph_.get_neighbors(internal_id);
-
-                for (uint32_t neighbor_internal_id : neighbors) {
-                    uint64_t neighbor_orig_id = graph_.id_map[neighbor_internal_id];
-                    if (cluster_node_set.count(neighbor_orig_id)) {
+                for (uint32_t i = graph_.row_ptr[internal_id]; i < graph_.row_ptr[internal_id + 1]; ++i) {
+                    if (cluster_assignment_[graph_.col_idx[i]] == cluster_idx) {
                         internal_degree++;
                     }
                 }
@@ -193,29 +231,19 @@ private:
             if (!k_valid) {
                 // Cluster is invalid - needs recomputation
                 invalid_cluster_indices.push_back(cluster_idx);
-                for (uint64_t orig_node_id : cluster.nodes) {
-                    if (graph_.node_map.count(orig_node_id)) {
-                        nodes_to_recompute.insert(graph_.node_map.at(orig_node_id));
-                    }
-                }
+                nodes_to_recompute.insert(members.begin(), members.end());
                 continue;
             }
 
             // Check for potential merges (external nodes promoted to this k-core)
             bool has_merge_candidates = false;
 
-            for (uint64_t orig_node_id : cluster.nodes) {
-                if (!graph_.node_map.count(orig_node_id)) continue;
-
-                uint32_t internal_id = graph_.node_map.at(orig_node_id);
-                std::vector<uint32_t> neighbors = graph_.get_neighbors(internal_id);
-
-                for (uint32_t neighbor_internal_id : neighbors) {
-                    uint64_t neighbor_orig_id = graph_.id_map[neighbor_internal_id];
+            for (uint32_t internal_id : members) {
+                for (uint32_t i = graph_.row_ptr[internal_id]; i < graph_.row_ptr[internal_id + 1]; ++i) {
+                    uint32_t neighbor = graph_.col_idx[i];
 
                     // Check if neighbor is outside cluster but has high enough core
-                    if (!cluster_node_set.count(neighbor_orig_id) &&
-                        core_numbers_[neighbor_internal_id] >= k) {
+                    if (cluster_assignment_[neighbor] != cluster_idx && core_numbers_[neighbor] >= k) {
                         has_merge_candidates = true;
                         break;
                     }
@@ -227,22 +255,14 @@ private:
             if (has_merge_candidates) {
                 // Needs recomputation due to potential merge
                 invalid_cluster_indices.push_back(cluster_idx);
-                for (uint64_t orig_node_id : cluster.nodes) {
-                    if (graph_.node_map.count(orig_node_id)) {
-                        nodes_to_recompute.insert(graph_.node_map.at(orig_node_id));
-                    }
-                }
+                nodes_to_recompute.insert(members.begin(), members.end());
 
                 // Also include high-core neighbors
-                for (uint64_t orig_node_id : cluster.nodes) {
-                    if (!graph_.node_map.count(orig_node_id)) continue;
-
-                    uint32_t internal_id = graph_.node_map.at(orig_node_id);
-                    std::vector<uint32_t> neighbors = graph_.get_neighbors(internal_id);
-
-                    for (uint32_t neighbor_internal_id : neighbors) {
-                        if (core_numbers_[neighbor_internal_id] >= k) {
-                            nodes_to_recompute.insert(neighbor_internal_id);
+                for (uint32_t internal_id : members) {
+                    for (uint32_t i = graph_.row_ptr[internal_id]; i < graph_.row_ptr[internal_id + 1]; ++i) {
+                        uint32_t neighbor = graph_.col_idx[i];
+                        if (core_numbers_[neighbor] >= k) {
+                            nodes_to_recompute.insert(neighbor);
                         }
                     }
                 }
@@ -251,6 +271,40 @@ private:
                 valid_cluster_indices.push_back(cluster_idx);
             }
         }
+
+        // High-core neighbours pulled into the recomputation may belong to
+        // clusters that were kept; those are recomputed as well, so that no
+        // node ends up in both a kept cluster and a recomputed one
+        std::vector<bool> invalid(clusters_.size(), false);
+        for (size_t cluster_idx : invalid_cluster_indices) {
+            invalid[cluster_idx] = true;
+        }
+        std::vector<uint32_t> extra_nodes;
+        for (uint32_t node : nodes_to_recompute) {
+            uint32_t cluster_idx = cluster_assignment_[node];
+            if (cluster_idx != UINT32_MAX && !invalid[cluster_idx]) {
+                invalid[cluster_idx] = true;
+                for (uint64_t orig_node_id : clusters_[cluster_idx].nodes) {
+                    extra_nodes.push_back(graph_.node_map.at(orig_node_id));
+                }
+            }
+        }
+        if (!extra_nodes.empty()) {
+            nodes_to_recompute.insert(extra_nodes.begin(), extra_nodes.end());
+            invalid_cluster_indices.clear();
+            std::vector<size_t> still_valid;
+            for (size_t cluster_idx = 0; cluster_idx < clusters_.size(); ++cluster_idx) {
+                if (invalid[cluster_idx]) {
+                    invalid_cluster_indices.push_back(cluster_idx);
+                }
+            }
+            for (size_t cluster_idx : valid_cluster_indices) {
+                if (!invalid[cluster_idx]) {
+                    still_valid.push_back(cluster_idx);
+                }
+            }
+            valid_cluster_indices.swap(still_valid);
+        }
     }
 
     /**
@@ -357,8 +411,7 @@ public:
                                    bool verbose = false) {
 
         if (batch_mode_) {
-            // In batch mode, just accumulate edges
-            pending_edges_.insert(pending_edges_.end(), edges.begin(), edges.end());
+            stage_edges(edges);
             return clusters_;
         }
 
@@ -389,16 +442,30 @@ public:
             return clusters_;
         }
 
+        // Edges not already in the graph, each once; only these change core numbers
+        std::vector<std::pair<uint32_t, uint32_t>> new_edges;
+        {
+            std::unordered_set<uint64_t> seen;
+            for (auto [u, v] : internal_edges) {
+                if (u == v) continue;
+                uint64_t key = (static_cast<uint64_t>(std::min(u, v)) << 32) | std::max(u, v);
+                if (seen.insert(key).second && !has_edge(u, v)) {
+                    new_edges.push_back({u, v});
+                }
+            }
+        }
+
         // Add edges to graph
         add_edges_batch(graph_, internal_edges);
 
+        // Update core numbers incrementally; they are kept current even when
+        // the clustering update is deferred
+        auto affected_nodes = update_core_numbers_incremental(new_edges);
+
         if (!recompute) {
             return clusters_;
         }
 
-        // Update core numbers incrementally
-        auto affected_nodes = update_core_numbers_incremental(internal_edges);
-
         auto recompute_start = std::chrono::high_resolution_clock::now();
 
         // Detect invalid clusters
@@ -474,8 +541,7 @@ public:
                                    bool verbose = false) {
 
         if (batch_mode_) {
-            // In batch mode, just accumulate nodes
-            pending_nodes_.insert(pending_nodes_.end(), nodes.begin(), nodes.end());
+            stage_nodes(nodes);
             return clusters_;
         }
 
@@ -515,6 +581,38 @@ public:
         return clusters_;
     }
 
+    /**
+     * Check that every edge endpoint exists in the graph or is in `nodes`
+     *
+     * @throws std::invalid_argument naming the first edge that fails
+     */
+    void validate_update(const std::vector<std::pair<uint64_t, uint64_t>>& edges,
+                         const std::vector<uint64_t>& nodes) const {
+        if (edges.empty()) {
+            return;
+        }
+
+        std::unordered_set<uint64_t> nodes_to_add(nodes.begin(), nodes.end());
+
+        for (const auto& [u, v] : edges) {
+            bool u_exists = graph_.node_map.count(u) || nodes_to_add.count(u);
+            bool v_exists = graph_.node_map.count(v) || nodes_to_add.count(v);
+
+            if (!u_exists || !v_exists) {
+                std::string missing_nodes;
+                if (!u_exists) missing_nodes += std::to_string(u);
+                if (!u_exists && !v_exists) missing_nodes += ", ";
+                if (!v_exists) missing_nodes += std::to_string(v);
+
+                throw std::invalid_argument(
+                    "Edge (" + std::to_string(u) + ", " + std::to_string(v) +
+                    ") references non-existent node(s): " + missing_nodes +
+                    ". All nodes in new_edges must either exist in the graph or be included in new_nodes."
+                );
+            }
+        }
+    }
+
     /**
      * Add both edges and nodes in a single update
      */
@@ -522,28 +620,7 @@ public:
                                const std::vector<uint64_t>& nodes,
                                bool verbose = false) {
 
-        // Validate that all edge endpoints exist or will be added
-        if (!edges.empty()) {
-            std::unordered_set<uint64_t> nodes_to_add(nodes.begin(), nodes.end());
-
-            for (const auto& [u, v] : edges) {
-                bool u_exists = graph_.node_map.count(u) || nodes_to_add.count(u);
-                bool v_exists = graph_.node_map.count(v) || nodes_to_add.count(v);
-
-                if (!u_exists || !v_exists) {
-                    std::string missing_nodes;
-                    if (!u_exists) missing_nodes += std::to_string(u);
-                    if (!u_exists && !v_exists) missing_nodes += ", ";
-                    if (!v_exists) missing_nodes += std::to_string(v);
-
-                    throw std::invalid_argument(
-                        "Edge (" + std::to_string(u) + ", " + std::to_string(v) +
-                        ") references non-existent node(s): " + missing_nodes +
-                        ". All nodes in new_edges must either exist in the graph or be included in new_nodes."
-                    );
-                }
-            }
-        }
+        validate_update(edges, nodes);
 
         // Add nodes first (without recomputation)
         if (!nodes.empty()) {
@@ -578,6 +655,21 @@ public:
         return add_nodes({}, true, verbose);
     }
 
+    /**
+     * Append edges to the pending batch without touching the graph or the
+     * clustering; they are applied by commit_batch()
+     */
+    void stage_edges(const std::vector<std::pair<uint64_t, uint64_t>>& edges) {
+        pending_edges_.insert(pending_edges_.end(), edges.begin(), edges.end());
+    }
+
+    /**
+     * Append nodes to the pending batch; they are applied by commit_batch()
+     */
+    void stage_nodes(const std::vector<uint64_t>& nodes) {
+        pending_nodes_.insert(pending_nodes_.end(), nodes.begin(), nodes.end());
+    }
+
     /**
      * Enter batch mode - accumulate updates without recomputation
      */
@@ -617,6 +709,7 @@ public:
     size_t get_num_nodes() const { return graph_.num_nodes; }
     size_t get_num_edges() const { return graph_.num_edges; }
     uint32_t get_max_core() const { return max_core_; }
+    uint32_t get_min_k() const { return min_k_; }
     bool is_batch_mode() const { return batch_mode_; }
 };
 
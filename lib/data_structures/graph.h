@@ -6,7 +6,7 @@
 #include <cstdint>
 #include <iostream>
 #include <algorithm>
-#include <set>
+#include <functional>
 #include <atomic>
 #include <omp.h>
 
@@ -181,53 +181,114 @@ void clean_graph_parallel(Graph& graph, int num_threads, bool verbose = false) {
     }
 }
 
+// Add a batch of undirected edges, rebuilding the CSR with every row sorted
+// and free of duplicates. The new entries are bucketed by row with a counting
+// sort, then each row is merged with its additions in parallel: one pass
+// sizes the merged rows, a prefix sum places them, and a second pass writes
+// them. Rows that are already sorted merge in linear time; others are sorted
+// once, in place, by the first pass.
 void add_edges_batch(Graph& g, const std::vector<std::pair<uint32_t, uint32_t>>& edges_to_add) {
     if (edges_to_add.empty()) return;
     
-    // Create temporary adjacency structure using sets to avoid duplicates
-    std::vector<std::set<uint32_t>> temp_adj(g.num_nodes);
+    const size_t n = g.num_nodes;
     
-    // First, add all existing edges from CSR to temp structure
-    for (uint32_t u = 0; u < g.num_nodes; ++u) {
-        for (uint32_t idx = g.row_ptr[u]; idx < g.row_ptr[u + 1]; ++idx) {
-            uint32_t v = g.col_idx[idx];
-            temp_adj[u].insert(v);
+    // Bucket the new entries (both directions for undirected graph) by row
+    std::vector<uint32_t> add_ptr(n + 1, 0);
+    for (const auto& [u, v] : edges_to_add) {
+        if (u >= n || v >= n || u == v) continue;
+        add_ptr[u + 1]++;
+        add_ptr[v + 1]++;
+    }
+    for (size_t u = 0; u < n; ++u) {
+        add_ptr[u + 1] += add_ptr[u];
+    }
+    std::vector<uint32_t> add_col(add_ptr[n]);
+    {
+        std::vector<uint32_t> next(add_ptr.begin(), add_ptr.end() - 1);
+        for (const auto& [u, v] : edges_to_add) {
+            if (u >= n || v >= n || u == v) continue;
+            add_col[next[u]++] = v;
+            add_col[next[v]++] = u;
         }
     }
     
-    // Add new edges (both directions for undirected graph)
-    size_t new_edges_added = 0;
-    for (const auto& [u, v] : edges_to_add) {
-        if (u >= g.num_nodes || v >= g.num_nodes || u == v) continue;
-        
-        // Check if edge already exists
-        if (temp_adj[u].count(v) == 0) {
-            temp_adj[u].insert(v);
-            temp_adj[v].insert(u);
-            new_edges_added++;
+    // Row u's existing neighbours, sorted and without duplicates. Rows left
+    // unsorted by the loader are sorted in place (the old CSR is replaced
+    // anyway); rows with duplicate entries are deduplicated into scratch.
+    auto sorted_row = [&](size_t u, std::vector<uint32_t>& scratch,
+                          const uint32_t*& begin, const uint32_t*& end) {
+        uint32_t* row = g.col_idx.data() + g.row_ptr[u];
+        uint32_t* row_end = g.col_idx.data() + g.row_ptr[u + 1];
+        begin = row;
+        end = row_end;
+        if (std::adjacent_find(row, row_end, std::greater_equal<uint32_t>()) == row_end) return;
+        if (!std::is_sorted(row, row_end)) {
+            std::sort(row, row_end);
+            if (std::adjacent_find(row, row_end) == row_end) return;
         }
-    }
+        scratch.assign(row, row_end);
+        scratch.erase(std::unique(scratch.begin(), scratch.end()), scratch.end());
+        begin = scratch.data();
+        end = scratch.data() + scratch.size();
+    };
     
-    // Count total edges for new CSR
-    size_t total_directed_edges = 0;
-    for (const auto& neighbors : temp_adj) {
-        total_directed_edges += neighbors.size();
+    // Sort and deduplicate each row's additions in place
+    #pragma omp parallel for schedule(dynamic, 1024)
+    for (size_t u = 0; u < n; ++u) {
+        std::sort(add_col.begin() + add_ptr[u], add_col.begin() + add_ptr[u + 1]);
     }
     
-    // Rebuild CSR structure
-    std::vector<uint32_t> new_row_ptr(g.num_nodes + 1);
-    std::vector<uint32_t> new_col_idx;
-    new_col_idx.reserve(total_directed_edges);
+    // Pass 1: size of each merged row, and how many entries are new
+    std::vector<uint32_t> new_row_ptr(n + 1, 0);
+    size_t new_entries = 0;
+    #pragma omp parallel reduction(+:new_entries)
+    {
+        std::vector<uint32_t> scratch;
+        #pragma omp for schedule(dynamic, 1024)
+        for (size_t u = 0; u < n; ++u) {
+            const uint32_t* begin;
+            const uint32_t* end;
+            sorted_row(u, scratch, begin, end);
+            
+            size_t size = end - begin;
+            const uint32_t* add = add_col.data() + add_ptr[u];
+            const uint32_t* add_end = add_col.data() + add_ptr[u + 1];
+            uint32_t last = UINT32_MAX;
+            for (; add < add_end; ++add) {
+                if (*add == last) continue;
+                last = *add;
+                if (!std::binary_search(begin, end, *add)) {
+                    size++;
+                    new_entries++;
+                }
+            }
+            new_row_ptr[u + 1] = size;
+        }
+    }
+    for (size_t u = 0; u < n; ++u) {
+        new_row_ptr[u + 1] += new_row_ptr[u];
+    }
     
-    new_row_ptr[0] = 0;
-    for (uint32_t u = 0; u < g.num_nodes; ++u) {
-        // Add all neighbors in sorted order (set maintains order)
-        for (uint32_t v : temp_adj[u]) {
-            new_col_idx.push_back(v);
+    // Pass 2: write the merged rows
+    std::vector<uint32_t> new_col_idx(new_row_ptr[n]);
+    #pragma omp parallel
+    {
+        std::vector<uint32_t> scratch;
+        #pragma omp for schedule(dynamic, 1024)
+        for (size_t u = 0; u < n; ++u) {
+            const uint32_t* begin;
+            const uint32_t* end;
+            sorted_row(u, scratch, begin, end);
+            
+            auto added_end = std::unique(add_col.begin() + add_ptr[u], add_col.begin() + add_ptr[u + 1]);
+            std::set_union(begin, end, add_col.begin() + add_ptr[u], added_end,
+                           new_col_idx.begin() + new_row_ptr[u]);
         }
-        new_row_ptr[u + 1] = new_col_idx.size();
     }
     
+    // Each new undirected edge adds one entry to each endpoint's row
+    size_t new_edges_added = new_entries / 2;
+    
     // Update graph structure
     g.row_ptr = std::move(new_row_ptr);
     g.col_idx = std::move(new_col_idx);
@@ -0,0 +1,154 @@
+#ifndef CLUSTER_IO_H
+#define CLUSTER_IO_H
+
+#include <string>
+#include <vector>
+#include <cstdio>
+#include <cmath>
+#include <charconv>
+
+#include "../algorithms/ikc.h"
+
+// Size of the output buffer; it is flushed with fwrite once it fills up
+constexpr size_t CLUSTER_WRITE_BUFFER_SIZE = 1 << 20;
+
+// Append an integer in decimal
+template <typename T>
+inline void append_integer(std::string& out, T value) {
+    char buf[24];
+    auto result = std::to_chars(buf, buf + sizeof(buf), value);
+    out.append(buf, result.ptr);
+}
+
+// Append the shortest round-trip representation of a double, laid out the
+// way Python's repr() does: fixed notation for exponents in [-5, 16), with a
+// trailing ".0" for integral values, and scientific notation otherwise
+inline void append_double_repr(std::string& out, double value) {
+    if (std::isnan(value)) {
+        out += "nan";
+        return;
+    }
+    if (std::isinf(value)) {
+        out += value < 0 ? "-inf" : "inf";
+        return;
+    }
+
+    // Shortest digits in scientific form, e.g. "-7.31635239398864e-09"
+    char buf[32];
+    auto result = std::to_chars(buf, buf + sizeof(buf), value, std::chars_format::scientific);
+    const char* ptr = buf;
+    if (*ptr == '-') {
+        out += '-';
+        ptr++;
+    }
+
+    std::string digits;
+    while (*ptr != 'e') {
+        if (*ptr != '.') digits += *ptr;
+        ptr++;
+    }
+    ptr++;  // Skip 'e'
+    int exponent = 0;
+    if (*ptr == '+') ptr++;
+    std::from_chars(ptr, result.ptr, exponent);
+
+    int num_digits = static_cast<int>(digits.size());
+    if (exponent < -4 || exponent >= 16) {
+        out += digits[0];
+        if (num_digits > 1) {
+            out += '.';
+            out.append(digits, 1, std::string::npos);
+        }
+        out += exponent < 0 ? "e-" : "e+";
+        int abs_exponent = std::abs(exponent);
+        if (abs_exponent < 10) out += '0';
+        append_integer(out, abs_exponent);
+    } else if (exponent < 0) {
+        out += "0.";
+        out.append(-exponent - 1, '0');
+        out += digits;
+    } else if (exponent + 1 < num_digits) {
+        out.append(digits, 0, exponent + 1);
+        out += '.';
+        out.append(digits, exponent + 1, std::string::npos);
+    } else {
+        out += digits;
+        out.append(exponent + 1 - num_digits, '0');
+        out += ".0";
+    }
+}
+
+// Write clusters to a file, numbering them from 1 in the given order.
+// TSV rows are node_id<tab>cluster_id with no header; CSV rows are
+// node_id,cluster_id,k_value,modularity under a header line.
+// Returns false (with errno set) if the file cannot be opened or written.
+bool write_clusters(const std::string& filename, const std::vector<const Cluster*>& clusters, bool tsv_format = false) {
+    FILE* file = std::fopen(filename.c_str(), "wb");
+    if (!file) {
+        return false;
+    }
+
+    std::string buffer;
+    buffer.reserve(CLUSTER_WRITE_BUFFER_SIZE + 256);
+    bool ok = true;
+
+    auto flush = [&]() {
+        if (ok && std::fwrite(buffer.data(), 1, buffer.size(), file) != buffer.size()) {
+            ok = false;
+        }
+        buffer.clear();
+    };
+
+    if (!tsv_format) {
+        buffer += "node_id,cluster_id,k_value,modularity\n";
+    }
+
+    // Everything after the node id is the same for every row of a cluster,
+    // so it is formatted once per cluster and appended as-is
+    std::string suffix;
+    size_t cluster_index = 0;
+    for (const Cluster* cluster : clusters) {
+        cluster_index++;
+        suffix.clear();
+        if (tsv_format) {
+            // TSV format: node_id<tab>cluster_id
+            suffix += '\t';
+            append_integer(suffix, cluster_index);
+        } else {
+            // CSV format: node_id,cluster_index,k_value,modularity
+            suffix += ',';
+            append_integer(suffix, cluster_index);
+            suffix += ',';
+            append_integer(suffix, cluster->k_value);
+            suffix += ',';
+            append_double_repr(suffix, cluster->modularity);
+        }
+        suffix += '\n';
+
+        for (uint64_t node : cluster->nodes) {
+            append_integer(buffer, node);
+            buffer += suffix;
+
+            if (buffer.size() >= CLUSTER_WRITE_BUFFER_SIZE) {
+                flush();
+            }
+        }
+    }
+    flush();
+
+    if (std::fclose(file) != 0) {
+        ok = false;
+    }
+    return ok;
+}
+
+bool write_clusters(const std::string& filename, const std::vector<Cluster>& clusters, bool tsv_format = false) {
+    std::vector<const Cluster*> cluster_ptrs;
+    cluster_ptrs.reserve(clusters.size());
+    for (const auto& cluster : clusters) {
+        cluster_ptrs.push_back(&cluster);
+    }
+    return write_clusters(filename, cluster_ptrs, tsv_format);
+}
+
+#endif // CLUSTER_IO_H
@@ -13,115 +13,97 @@
 #include <utility>
 #include <chrono>
 #include <algorithm>  // For std::sort
+#include <charconv>
+#include <cstring>
+#include <cerrno>
+#include <system_error>
 #include <omp.h>
 
 #include "../data_structures/graph.h"
 
 #include "mapped_file.h"
 
-Graph load_undirected_tsv_edgelist_parallel(const std::string& filename, int num_threads = std::thread::hardware_concurrency(), bool verbose = false) {
-    Graph graph;
-    MappedFile file;
-    
-    if (!file.open(filename)) {
-        std::cerr << "Failed to open file: " << filename << std::endl;
-        return graph;
-    }
-    
-    omp_set_num_threads(num_threads);
-    
-    const char* data = file.data();
-    size_t file_size = file.size();
-    
-    if (verbose) {
-        std::cout << "File size: " << file_size / (1024 * 1024) << " MB" << std::endl;
-        std::cout << "Step 1: Parsing file and collecting edges..." << std::endl;
+// Return a pointer to the first '\n' in [ptr, end), or end if there is none.
+// memchr is vectorized by common C libraries, so scans run many bytes at a time.
+inline const char* find_newline(const char* ptr, const char* end) {
+    if (ptr >= end) return end;
+    const void* newline = std::memchr(ptr, '\n', end - ptr);
+    return newline ? static_cast<const char*>(newline) : end;
+}
+
+// Count the lines in [ptr, end), including a last line without a newline
+inline size_t count_lines(const char* ptr, const char* end) {
+    size_t lines = 0;
+    while (ptr < end) {
+        ptr = find_newline(ptr, end) + 1;
+        lines++;
     }
-    
-    // Step 1: Parse file in parallel chunks
-    size_t chunk_size = 64 * 1024 * 1024; // 64 MB chunks
-    size_t num_chunks = (file_size + chunk_size - 1) / chunk_size;
-    
-    std::vector<std::vector<std::pair<uint64_t, uint64_t>>> thread_edges(num_threads);
-    std::vector<std::unordered_set<uint64_t>> thread_nodes(num_threads);
-    
-    #pragma omp parallel
-    {
-        int thread_id = omp_get_thread_num();
-        thread_edges[thread_id].reserve(1000000);
-        
-        #pragma omp for schedule(dynamic)
-        for (size_t chunk_idx = 0; chunk_idx < num_chunks; ++chunk_idx) {
-            size_t chunk_begin = chunk_idx * chunk_size;
-            size_t chunk_end = std::min(chunk_begin + chunk_size, file_size);
-            
-            // Adjust chunk_begin to start at beginning of a line (except first chunk)
-            if (chunk_begin > 0) {
-                while (chunk_begin < file_size && data[chunk_begin-1] != '\n') {
-                    chunk_begin++;
-                }
-            }
-            
-            // Adjust chunk_end to end at end of a complete line (except last chunk)
-            if (chunk_end < file_size) {
-                while (chunk_end < file_size && data[chunk_end] != '\n') {
-                    chunk_end++;
-                }
-                if (chunk_end < file_size) chunk_end++; // Include the newline
-            }
-            
-            // Skip empty chunks that might result from boundary adjustments
-            if (chunk_begin >= chunk_end) continue;
-            
-            // Process the chunk
-            const char* ptr = data + chunk_begin;
-            const char* end = data + chunk_end;
-            
-            while (ptr < end) {
-                // Parse source node
-                uint64_t src = 0;
-                while (ptr < end && *ptr >= '0' && *ptr <= '9') {
-                    src = src * 10 + (*ptr - '0');
-                    ptr++;
-                }
-                
-                // Skip tab
-                if (ptr < end && *ptr == '\t') ptr++;
-                
-                // Parse target node
-                uint64_t dst = 0;
-                while (ptr < end && *ptr >= '0' && *ptr <= '9') {
-                    dst = dst * 10 + (*ptr - '0');
-                    ptr++;
-                }
-                
-                // Store edge and nodes
-                thread_edges[thread_id].emplace_back(src, dst);
-                thread_nodes[thread_id].insert(src);
-                thread_nodes[thread_id].insert(dst);
-                
-                // Skip to next line
-                while (ptr < end && *ptr != '\n') ptr++;
-                if (ptr < end) ptr++; // Skip newline
-            }
+    return lines;
+}
+
+// Sort ids in place with an LSD radix sort (11-bit digits, only as many
+// passes as the largest id needs) and drop duplicates
+inline void radix_sort_unique(std::vector<uint64_t>& values) {
+    constexpr int DIGIT_BITS = 11;
+    constexpr size_t NUM_BUCKETS = size_t(1) << DIGIT_BITS;
+
+    uint64_t max_value = 0;
+    for (uint64_t value : values) max_value |= value;
+
+    std::vector<uint64_t> buffer(values.size());
+    std::vector<size_t> offsets(NUM_BUCKETS + 1);
+    for (int shift = 0; shift < 64 && (max_value >> shift) != 0; shift += DIGIT_BITS) {
+        std::fill(offsets.begin(), offsets.end(), 0);
+        for (uint64_t value : values) {
+            offsets[((value >> shift) & (NUM_BUCKETS - 1)) + 1]++;
         }
+        for (size_t b = 0; b < NUM_BUCKETS; ++b) {
+            offsets[b + 1] += offsets[b];
+        }
+        for (uint64_t value : values) {
+            buffer[offsets[(value >> shift) & (NUM_BUCKETS - 1)]++] = value;
+        }
+        values.swap(buffer);
     }
+
+    values.erase(std::unique(values.begin(), values.end()), values.end());
+}
+
+// Build an undirected graph from per-thread lists of edges between original
+// node ids (one list per thread; the lists are consumed). Dense ids follow
+// the sorted order of the original ids.
+Graph build_undirected_graph(std::vector<std::vector<std::pair<uint64_t, uint64_t>>>& thread_edges, bool verbose = false) {
+    Graph graph;
+    const int num_threads = static_cast<int>(thread_edges.size());
+    std::vector<std::vector<uint64_t>> thread_nodes(num_threads);
     
     if (verbose) {
         std::cout << "Step 2: Building global node mapping..." << std::endl;
     }
     
-    // Merge thread-local node sets
-    std::unordered_set<uint64_t> all_nodes_set;
-    for (const auto& nodes : thread_nodes) {
-        all_nodes_set.insert(nodes.begin(), nodes.end());
+    // Collect each thread's distinct endpoints with a radix sort instead of
+    // hashing every endpoint, then merge the sorted runs. The sorted order
+    // also makes the mapping to dense ids deterministic.
+    #pragma omp parallel for
+    for (int t = 0; t < num_threads; ++t) {
+        auto& nodes = thread_nodes[t];
+        nodes.reserve(2 * thread_edges[t].size());
+        for (const auto& edge : thread_edges[t]) {
+            nodes.push_back(edge.first);
+            nodes.push_back(edge.second);
+        }
+        radix_sort_unique(nodes);
     }
-    thread_nodes.clear(); // Free memory
     
-    // CRITICAL FIX: Convert to sorted vector for deterministic ordering
-    std::vector<uint64_t> all_nodes(all_nodes_set.begin(), all_nodes_set.end());
-    std::sort(all_nodes.begin(), all_nodes.end()); // Sort to ensure deterministic mapping
-    all_nodes_set.clear(); // Free memory
+    std::vector<uint64_t> all_nodes;
+    for (auto& nodes : thread_nodes) {
+        size_t middle = all_nodes.size();
+        all_nodes.insert(all_nodes.end(), nodes.begin(), nodes.end());
+        std::inplace_merge(all_nodes.begin(), all_nodes.begin() + middle, all_nodes.end());
+        all_nodes.erase(std::unique(all_nodes.begin(), all_nodes.end()), all_nodes.end());
+        std::vector<uint64_t>().swap(nodes); // Free memory
+    }
+    thread_nodes.clear();
     
     // Build node mapping with deterministic order
     graph.num_nodes = all_nodes.size();
@@ -154,29 +136,45 @@ Graph load_undirected_tsv_edgelist_parallel(const std::string& filename, int num
         std::cout << "Step 3: Counting degrees..." << std::endl;
     }
     
-    // Step 3: Count degrees in parallel
-    std::vector<uint32_t> degree(graph.num_nodes, 0);
+    // Step 3: Translate each thread's edges to dense node ids, looking every
+    // endpoint up in node_map exactly once, then count degrees in parallel
+    std::vector<std::vector<std::pair<uint32_t, uint32_t>>> thread_dense_edges(num_threads);
+    std::vector<std::vector<uint32_t>> thread_degree(num_threads);
     
     #pragma omp parallel for
     for (int t = 0; t < num_threads; ++t) {
-        std::vector<uint32_t> local_degree(graph.num_nodes, 0);
-        
+        auto& dense_edges = thread_dense_edges[t];
+        dense_edges.reserve(thread_edges[t].size());
         for (const auto& edge : thread_edges[t]) {
-            uint32_t src_id = graph.node_map[edge.first];
-            uint32_t dst_id = graph.node_map[edge.second];
-            local_degree[src_id]++;
-            local_degree[dst_id]++;
+            dense_edges.emplace_back(graph.node_map.find(edge.first)->second,
+                                     graph.node_map.find(edge.second)->second);
         }
+        std::vector<std::pair<uint64_t, uint64_t>>().swap(thread_edges[t]); // Free memory
         
-        // Merge local degrees into global degree array
-        #pragma omp critical
-        {
-            for (uint32_t i = 0; i < graph.num_nodes; ++i) {
-                degree[i] += local_degree[i];
-            }
+        auto& local_degree = thread_degree[t];
+        local_degree.assign(graph.num_nodes, 0);
+        for (const auto& edge : dense_edges) {
+            local_degree[edge.first]++;
+            local_degree[edge.second]++;
         }
     }
     
+    // Merge the local degrees in parallel over contiguous blocks of nodes.
+    // Each thread's count is replaced by the number of entries the threads
+    // before it contribute to the node's row, i.e. where its own entries
+    // start within that row.
+    std::vector<uint32_t> degree(graph.num_nodes, 0);
+    #pragma omp parallel for schedule(static)
+    for (uint32_t i = 0; i < graph.num_nodes; ++i) {
+        uint32_t total = 0;
+        for (int t = 0; t < num_threads; ++t) {
+            uint32_t count = thread_degree[t][i];
+            thread_degree[t][i] = total;
+            total += count;
+        }
+        degree[i] = total;
+    }
+    
     if (verbose) {
         std::cout << "Step 4: Building CSR structure..." << std::endl;
     }
@@ -187,30 +185,31 @@ Graph load_undirected_tsv_edgelist_parallel(const std::string& filename, int num
     for (uint32_t i = 0; i < graph.num_nodes; ++i) {
         graph.row_ptr[i + 1] = graph.row_ptr[i] + degree[i];
     }
+    degree.clear(); // Free memory
     
     // Allocate column indices
     size_t total_directed_edges = graph.row_ptr.back();
     graph.col_idx.resize(total_directed_edges);
     
-    // Use degree array as offset tracker (reset to 0)
-    std::fill(degree.begin(), degree.end(), 0);
-    
-    // Fill CSR structure - this needs to be sequential or use atomic operations
-    // Option 1: Sequential (simpler and often fast enough)
+    // Fill CSR structure in parallel: every thread writes its own slots of
+    // each row, so rows come out in the same order as a sequential fill
+    #pragma omp parallel for
     for (int t = 0; t < num_threads; ++t) {
-        for (const auto& edge : thread_edges[t]) {
-            uint32_t src_id = graph.node_map[edge.first];
-            uint32_t dst_id = graph.node_map[edge.second];
+        auto& offset = thread_degree[t];
+        for (const auto& edge : thread_dense_edges[t]) {
+            uint32_t src_id = edge.first;
+            uint32_t dst_id = edge.second;
             
             // Add edge src -> dst
-            graph.col_idx[graph.row_ptr[src_id] + degree[src_id]++] = dst_id;
+            graph.col_idx[graph.row_ptr[src_id] + offset[src_id]++] = dst_id;
             
             // Add edge dst -> src (undirected)
-            graph.col_idx[graph.row_ptr[dst_id] + degree[dst_id]++] = src_id;
+            graph.col_idx[graph.row_ptr[dst_id] + offset[dst_id]++] = src_id;
         }
+        std::vector<uint32_t>().swap(offset); // Free memory
     }
     
-    thread_edges.clear(); // Free memory
+    thread_dense_edges.clear(); // Free memory
     
     if (verbose) {
         std::cout << "Loaded undirected graph with " << graph.num_nodes << " nodes and " 
@@ -220,6 +219,118 @@ Graph load_undirected_tsv_edgelist_parallel(const std::string& filename, int num
     return graph;
 }
 
+// Build an undirected graph from an in-memory TSV edge list
+Graph parse_undirected_tsv_edgelist(const char* data, size_t file_size, int num_threads = std::thread::hardware_concurrency(), bool verbose = false) {
+    omp_set_num_threads(num_threads);
+    
+    if (verbose) {
+        std::cout << "File size: " << file_size / (1024 * 1024) << " MB" << std::endl;
+        std::cout << "Step 1: Parsing file and collecting edges..." << std::endl;
+    }
+    
+    // Step 1: Parse file in parallel, one contiguous byte range per thread
+    size_t num_chunks = static_cast<size_t>(num_threads);
+    size_t chunk_size = (file_size + num_chunks - 1) / num_chunks;
+    
+    std::vector<std::vector<std::pair<uint64_t, uint64_t>>> thread_edges(num_threads);
+    
+    #pragma omp parallel
+    {
+        int thread_id = omp_get_thread_num();
+        
+        #pragma omp for schedule(static)
+        for (size_t chunk_idx = 0; chunk_idx < num_chunks; ++chunk_idx) {
+            size_t chunk_begin = chunk_idx * chunk_size;
+            size_t chunk_end = std::min(chunk_begin + chunk_size, file_size);
+            
+            // Move both boundaries forward to the start of the next line, so
+            // a chunk owns every line that starts inside it (the first chunk
+            // starts at 0 and the last ends at file_size). A boundary that
+            // already follows a newline stays put; applying the same rule to
+            // both ends keeps neighbouring chunks from sharing a line.
+            auto align_to_line_start = [&](size_t pos) -> size_t {
+                if (pos == 0 || pos >= file_size) return std::min(pos, file_size);
+                const char* newline = find_newline(data + pos - 1, data + file_size);
+                return newline - data + (newline < data + file_size ? 1 : 0);
+            };
+            chunk_begin = align_to_line_start(chunk_begin);
+            chunk_end = align_to_line_start(chunk_end);
+            
+            // Skip empty chunks that might result from boundary adjustments
+            if (chunk_begin >= chunk_end) continue;
+            
+            // Process the chunk
+            const char* ptr = data + chunk_begin;
+            const char* end = data + chunk_end;
+            
+            // A quick newline count sizes the edge vector up front, so the
+            // parse loop below never reallocates
+            thread_edges[thread_id].reserve(thread_edges[thread_id].size() + count_lines(ptr, end));
+            
+            while (ptr < end) {
+                // Parse source node
+                uint64_t src = 0;
+                ptr = std::from_chars(ptr, end, src).ptr;
+                
+                // Skip tab
+                if (ptr < end && *ptr == '\t') ptr++;
+                
+                // Parse target node
+                uint64_t dst = 0;
+                ptr = std::from_chars(ptr, end, dst).ptr;
+                
+                // Store edge
+                thread_edges[thread_id].emplace_back(src, dst);
+                
+                // Skip to next line
+                ptr = find_newline(ptr, end);
+                if (ptr < end) ptr++; // Skip newline
+            }
+        }
+    }
+    
+    return build_undirected_graph(thread_edges, verbose);
+}
+
+// Build an undirected graph from an in-memory edge list of original node ids
+Graph build_undirected_graph_from_edges(const std::vector<std::pair<uint64_t, uint64_t>>& edges, int num_threads = std::thread::hardware_concurrency(), bool verbose = false) {
+    if (num_threads <= 0) num_threads = 1;
+    omp_set_num_threads(num_threads);
+    
+    // Split the edges into one contiguous slice per thread, as the file
+    // parser does with byte ranges
+    size_t chunk_size = (edges.size() + num_threads - 1) / num_threads;
+    std::vector<std::vector<std::pair<uint64_t, uint64_t>>> thread_edges(num_threads);
+    for (int t = 0; t < num_threads; ++t) {
+        size_t begin = std::min(edges.size(), t * chunk_size);
+        size_t end = std::min(edges.size(), begin + chunk_size);
+        thread_edges[t].assign(edges.begin() + begin, edges.begin() + end);
+    }
+    return build_undirected_graph(thread_edges, verbose);
+}
+
+// Load an undirected graph from a TSV edge list file. With use_mmap the file
+// is memory-mapped; otherwise it is read into a buffer first.
+// Throws std::system_error (carrying errno) if the file cannot be opened.
+Graph load_undirected_tsv_edgelist_parallel(const std::string& filename, int num_threads = std::thread::hardware_concurrency(), bool verbose = false, bool use_mmap = true) {
+    if (use_mmap) {
+        MappedFile file;
+        if (!file.open(filename)) {
+            throw std::system_error(errno, std::generic_category(), filename);
+        }
+        return parse_undirected_tsv_edgelist(file.data(), file.size(), num_threads, verbose);
+    }
+    
+    std::ifstream infile(filename, std::ios::binary | std::ios::ate);
+    if (!infile.is_open()) {
+        throw std::system_error(errno, std::generic_category(), filename);
+    }
+    std::string buffer(static_cast<size_t>(infile.tellg()), '\0');
+    infile.seekg(0);
+    infile.read(&buffer[0], buffer.size());
+    return parse_undirected_tsv_edgelist(buffer.data(), buffer.size(), num_threads, verbose);
+}
+
 // Save graph to a TSV edgelist file
 bool save_graph_edgelist(const std::string& filename, const Graph& graph, bool verbose = false) {
     std::ofstream outfile(filename);
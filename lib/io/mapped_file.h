@@ -32,6 +32,10 @@ public:
         }
         
         file_size = sb.st_size;
+        if (file_size == 0) {
+            // mmap rejects empty mappings; an empty file is simply no data
+            return true;
+        }
         mapped_data = mmap(nullptr, file_size, PROT_READ, MAP_PRIVATE, fd, 0);
         
         if (mapped_data == MAP_FAILED) {
@@ -41,8 +45,10 @@ public:
             return false;
         }
         
-        // Advise the kernel that we'll access this sequentially
+        // Advise the kernel that we'll access this sequentially, and start
+        // reading it in now
         madvise(mapped_data, file_size, MADV_SEQUENTIAL);
+        madvise(mapped_data, file_size, MADV_WILLNEED);
         return true;
     }
     
@@ -2,14 +2,299 @@
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
 #include <pybind11/functional.h>
+#include <chrono>
+#include <memory>
+#include <optional>
 #include "../lib/io/graph_io.h"
+#include "../lib/io/cluster_io.h"
 #include "../lib/algorithms/ikc.h"
 #include "../lib/algorithms/streaming_ikc.h"
 #include "../lib/algorithms/maximal_kcore_search.h"
+#include "../lib/algorithms/kcore_component_search.h"
 #include "../lib/data_structures/graph.h"
 
+// Every kernel is parallelized with OpenMP; without it they would silently
+// run on one thread
+#ifndef _OPENMP
+#error "IKC must be compiled with OpenMP enabled (e.g. -fopenmp)"
+#endif
+
 namespace py = pybind11;
 
+// Core numbers passed in from Python: any sequence, converted to a
+// contiguous uint32 array (no conversion for arrays that already match)
+using CoreNumbersArray = py::array_t<uint32_t, py::array::c_style | py::array::forcecast>;
+
+std::vector<uint32_t> to_core_numbers(const CoreNumbersArray& core_numbers) {
+    return std::vector<uint32_t>(core_numbers.data(), core_numbers.data() + core_numbers.size());
+}
+
+// Core numbers are indexed by internal node id, so they must have exactly
+// one entry per node of the graph they are used with
+void check_core_numbers(const Graph& graph, size_t num_core_numbers) {
+    if (num_core_numbers != graph.num_nodes) {
+        throw py::value_error("core_numbers must have one entry per node");
+    }
+}
+
+std::vector<uint32_t> to_core_numbers(const Graph& graph, const CoreNumbersArray& core_numbers) {
+    check_core_numbers(graph, static_cast<size_t>(core_numbers.size()));
+    return to_core_numbers(core_numbers);
+}
+
+// Edges passed in from Python: an (E, 2) array of non-negative integer node
+// ids, or anything NumPy can convert to one. Unsigned arrays are read as
+// uint64 (no conversion for arrays that already match) and signed ones are
+// checked for negative ids; other dtypes are rejected rather than cast, so a
+// float or negative id can't silently become another node.
+using EdgeArray = py::array_t<uint64_t, py::array::c_style | py::array::forcecast>;
+using SignedEdgeArray = py::array_t<int64_t, py::array::c_style | py::array::forcecast>;
+
+template <typename Id>
+std::vector<std::pair<uint64_t, uint64_t>> read_edge_pairs(const Id* data, size_t num_edges) {
+    std::vector<std::pair<uint64_t, uint64_t>> pairs(num_edges);
+    for (size_t i = 0; i < num_edges; i++) {
+        pairs[i] = {static_cast<uint64_t>(data[2 * i]), static_cast<uint64_t>(data[2 * i + 1])};
+    }
+    return pairs;
+}
+
+std::vector<std::pair<uint64_t, uint64_t>> to_edge_pairs(const py::object& edges_obj) {
+    py::array edges = py::array::ensure(edges_obj);
+    if (!edges) {
+        throw py::type_error("edges must be an array of integer node ids");
+    }
+    if (edges.size() == 0) {
+        return {};
+    }
+    if (edges.ndim() != 2 || edges.shape(1) != 2) {
+        throw py::value_error("edges must have shape (num_edges, 2)");
+    }
+
+    const size_t num_edges = static_cast<size_t>(edges.shape(0));
+    const char kind = edges.dtype().kind();
+    if (kind == 'u') {
+        EdgeArray ids = EdgeArray::ensure(edges);
+        return read_edge_pairs(ids.data(), num_edges);
+    }
+    if (kind != 'i') {
+        throw py::type_error("edges must hold integer node ids, not " +
+                             py::str(edges.dtype()).cast<std::string>());
+    }
+
+    SignedEdgeArray ids = SignedEdgeArray::ensure(edges);
+    const int64_t* data = ids.data();
+    for (size_t i = 0; i < 2 * num_edges; i++) {
+        if (data[i] < 0) {
+            throw py::value_error("node ids must be non-negative, got " + std::to_string(data[i]));
+        }
+    }
+    return read_edge_pairs(data, num_edges);
+}
+
+// Expose a vector owned by `owner` as a read-only NumPy array without copying.
+// The array keeps `owner` alive, so it stays valid as long as it is referenced.
+template <typename T>
+py::array_t<T> readonly_array_view(const std::vector<T>& values, py::handle owner) {
+    py::array_t<T> array({static_cast<py::ssize_t>(values.size())},
+                         {static_cast<py::ssize_t>(sizeof(T))},
+                         values.data(), owner);
+    py::detail::array_proxy(array.ptr())->flags &= ~py::detail::npy_api::NPY_ARRAY_WRITEABLE_;
+    return array;
+}
+
+// Pack a batch of maximal k-core results into NumPy arrays:
+// (k_values, sizes, offsets, nodes), where the nodes of result i are
+// nodes[offsets[i]:offsets[i + 1]] and a size of 0 means not found
+py::tuple maximal_kcore_results_to_arrays(const std::vector<ikc::MaximalKCoreResult>& results) {
+    size_t total = 0;
+    for (const auto& r : results) {
+        total += r.nodes.size();
+    }
+
+    py::array_t<uint32_t> k_values(results.size());
+    py::array_t<int64_t> sizes(results.size());
+    py::array_t<int64_t> offsets(results.size() + 1);
+    py::array_t<uint64_t> nodes(total);
+
+    auto k_ptr = k_values.mutable_data();
+    auto size_ptr = sizes.mutable_data();
+    auto offset_ptr = offsets.mutable_data();
+    auto node_ptr = nodes.mutable_data();
+
+    int64_t offset = 0;
+    offset_ptr[0] = 0;
+    for (size_t i = 0; i < results.size(); i++) {
+        const auto& r = results[i];
+        k_ptr[i] = r.k_value;
+        size_ptr[i] = r.found ? r.nodes.size() : 0;
+        std::copy(r.nodes.begin(), r.nodes.end(), node_ptr + offset);
+        offset += r.nodes.size();
+        offset_ptr[i + 1] = offset;
+    }
+
+    return py::make_tuple(k_values, sizes, offsets, nodes);
+}
+
+// Batched maximal k-core search; the searches run without the GIL
+py::tuple run_maximal_kcores(const Graph& graph,
+                             py::array_t<uint64_t, py::array::c_style | py::array::forcecast> query_nodes,
+                             const std::vector<uint32_t>& core_numbers) {
+    check_core_numbers(graph, core_numbers.size());
+    std::vector<uint64_t> queries(query_nodes.data(), query_nodes.data() + query_nodes.size());
+    std::vector<ikc::MaximalKCoreResult> results;
+    {
+        py::gil_scoped_release release;
+        results = ikc::find_maximal_kcores(graph, queries, core_numbers);
+    }
+    return maximal_kcore_results_to_arrays(results);
+}
+
+// Reference the Cluster objects of a Python sequence in place (not copied).
+// Must be called with the GIL held; the pointers stay valid while the
+// sequence is alive.
+std::vector<const Cluster*> cluster_pointers(const py::sequence& clusters) {
+    std::vector<const Cluster*> cluster_ptrs;
+    cluster_ptrs.reserve(clusters.size());
+    for (auto item : clusters) {
+        cluster_ptrs.push_back(&item.cast<const Cluster&>());
+    }
+    return cluster_ptrs;
+}
+
+// Write a sequence of Cluster objects to a file. The clusters are collected
+// while the GIL is held; formatting and I/O run without it.
+// Failures raise OSError, the same as Python's open() would.
+void write_cluster_sequence(const std::string& filename, const py::sequence& clusters, bool tsv_format) {
+    std::vector<const Cluster*> cluster_ptrs = cluster_pointers(clusters);
+
+    bool ok;
+    int saved_errno;
+    {
+        py::gil_scoped_release release;
+        ok = write_clusters(filename, cluster_ptrs, tsv_format);
+        saved_errno = errno;
+    }
+    if (!ok) {
+        errno = saved_errno;
+        PyErr_SetFromErrnoWithFilename(PyExc_OSError, filename.c_str());
+        throw py::error_already_set();
+    }
+}
+
+// Flatten a sequence of Cluster objects into (node_id, cluster_id, k_value,
+// modularity) columns with one entry per clustered node, numbering the
+// clusters from 1 in order. The columns are filled without the GIL.
+py::tuple clusters_to_arrays(const py::sequence& clusters) {
+    std::vector<const Cluster*> cluster_ptrs = cluster_pointers(clusters);
+    size_t total = 0;
+    for (const Cluster* cluster : cluster_ptrs) {
+        total += cluster->nodes.size();
+    }
+
+    py::array_t<int64_t> node_ids(total);
+    py::array_t<int32_t> cluster_ids(total);
+    py::array_t<int32_t> k_values(total);
+    py::array_t<double> modularities(total);
+
+    int64_t* node_ptr = node_ids.mutable_data();
+    int32_t* cluster_ptr = cluster_ids.mutable_data();
+    int32_t* k_ptr = k_values.mutable_data();
+    double* modularity_ptr = modularities.mutable_data();
+    {
+        py::gil_scoped_release release;
+        size_t offset = 0;
+        for (size_t i = 0; i < cluster_ptrs.size(); i++) {
+            const Cluster& cluster = *cluster_ptrs[i];
+            size_t size = cluster.nodes.size();
+            std::copy(cluster.nodes.begin(), cluster.nodes.end(), node_ptr + offset);
+            std::fill_n(cluster_ptr + offset, size, static_cast<int32_t>(i + 1));
+            std::fill_n(k_ptr + offset, size, static_cast<int32_t>(cluster.k_value));
+            std::fill_n(modularity_ptr + offset, size, cluster.modularity);
+            offset += size;
+        }
+    }
+
+    return py::make_tuple(node_ids, cluster_ids, k_values, modularities);
+}
+
+// Rate-limited bridge from the IKC progress callback, which C++ calls with the
+// current max k once per round, to a Python callable taking
+// (current_k, initial_k). The GIL is only acquired when a call is reported:
+// the first one, then at most once every `interval_ms` and only after the
+// max k has dropped by at least `stride` levels (0 picks ~1% of the range).
+class __attribute__((visibility("hidden"))) ThrottledProgress {
+public:
+    ThrottledProgress(py::object callback, uint32_t min_k, uint32_t stride, double interval_ms)
+        : callback_(std::move(callback)), min_k_(min_k), stride_(stride),
+          interval_(interval_ms / 1000.0) {}
+
+    void operator()(uint32_t current_k) {
+        last_k_ = current_k;
+        if (!started_) {
+            started_ = true;
+            initial_k_ = current_k;
+            if (stride_ == 0) {
+                stride_ = std::max<uint32_t>(1, (initial_k_ > min_k_ ? initial_k_ - min_k_ : 0) / 100);
+            }
+        } else if (current_k + stride_ > last_reported_k_ ||
+                   std::chrono::steady_clock::now() - last_time_ < interval_) {
+            return;
+        }
+        py::gil_scoped_acquire acquire;
+        report(current_k);
+    }
+
+    // Report the last level seen if it was throttled; call with the GIL held
+    void finish() {
+        if (started_ && last_k_ != last_reported_k_) {
+            report(last_k_);
+        }
+    }
+
+private:
+    void report(uint32_t current_k) {
+        callback_(current_k, initial_k_);
+        last_reported_k_ = current_k;
+        last_time_ = std::chrono::steady_clock::now();
+    }
+
+    py::object callback_;
+    uint32_t min_k_;
+    uint32_t stride_;
+    std::chrono::duration<double> interval_;
+    bool started_ = false;
+    uint32_t initial_k_ = 0;
+    uint32_t last_k_ = 0;
+    uint32_t last_reported_k_ = 0;
+    std::chrono::steady_clock::time_point last_time_;
+};
+
+// Run an IKC clustering with the GIL released, reporting progress to an
+// optional Python callback through ThrottledProgress
+template <typename Run>
+std::vector<Cluster> run_with_progress(const py::object& progress_callback, uint32_t min_k,
+                                       uint32_t progress_stride, double progress_interval_ms,
+                                       Run run) {
+    std::shared_ptr<ThrottledProgress> progress;
+    std::function<void(uint32_t)> callback = nullptr;
+    if (!progress_callback.is_none()) {
+        progress = std::make_shared<ThrottledProgress>(progress_callback, min_k, progress_stride,
+                                                       progress_interval_ms);
+        callback = [progress](uint32_t current_k) { (*progress)(current_k); };
+    }
+
+    std::vector<Cluster> clusters;
+    {
+        py::gil_scoped_release release;
+        clusters = run(callback);
+    }
+    if (progress) {
+        progress->finish();
+    }
+    return clusters;
+}
+
 PYBIND11_MODULE(_ikc, m) {
     m.doc() = "Python bindings for IKC (Iterative K-Core Clustering)";
 
@@ -27,32 +312,111 @@ PYBIND11_MODULE(_ikc, m) {
     // Bind Cluster class
     py::class_<Cluster>(m, "Cluster")
         .def(py::init<const std::vector<uint64_t>&, uint32_t, double>())
-        .def_readonly("nodes", &Cluster::nodes)
+        // Read-only view of the node IDs, without copying them
+        .def_property_readonly("nodes", [](py::object self) {
+            return readonly_array_view(self.cast<const Cluster&>().nodes, self);
+        })
         .def_readonly("k_value", &Cluster::k_value)
         .def_readonly("modularity", &Cluster::modularity)
+        .def("__len__", [](const Cluster& c) { return c.nodes.size(); })
         .def("__repr__", [](const Cluster& c) {
             return "<Cluster nodes=" + std::to_string(c.nodes.size()) +
                    " k=" + std::to_string(c.k_value) +
                    " modularity=" + std::to_string(c.modularity) + ">";
         });
 
+    // Bind cluster writers
+    m.def("write_clusters_tsv",
+          [](const std::string& filename, const py::sequence& clusters) {
+              write_cluster_sequence(filename, clusters, true);
+          },
+          py::arg("filename"),
+          py::arg("clusters"),
+          "Write clusters as node_id<tab>cluster_id rows (no header)");
+
+    m.def("clusters_to_arrays",
+          &clusters_to_arrays,
+          py::arg("clusters"),
+          "Flatten clusters into (node_id, cluster_id, k_value, modularity) NumPy arrays "
+          "with one entry per clustered node");
+
+    m.def("write_clusters_csv",
+          [](const std::string& filename, const py::sequence& clusters) {
+              write_cluster_sequence(filename, clusters, false);
+          },
+          py::arg("filename"),
+          py::arg("clusters"),
+          "Write clusters as node_id,cluster_id,k_value,modularity rows with a header");
+
     // Bind graph loading function
+    // Open failures surface as the matching OSError subclass
+    // (e.g. FileNotFoundError) with the file name attached
     m.def("load_graph",
-          &load_undirected_tsv_edgelist_parallel,
+          [](const std::string& filename, int num_threads, bool verbose, bool mmap) {
+              try {
+                  py::gil_scoped_release release;
+                  return load_undirected_tsv_edgelist_parallel(filename, num_threads, verbose, mmap);
+              } catch (const std::system_error& e) {
+                  errno = e.code().value();
+                  PyErr_SetFromErrnoWithFilename(PyExc_OSError, filename.c_str());
+                  throw py::error_already_set();
+              }
+          },
           py::arg("filename"),
           py::arg("num_threads") = std::thread::hardware_concurrency(),
           py::arg("verbose") = false,
+          py::arg("mmap") = true,
           "Load an undirected graph from TSV edge list file");
 
+    m.def("graph_from_edges",
+          [](const py::object& edges, int num_threads, bool verbose) {
+              auto pairs = to_edge_pairs(edges);
+              py::gil_scoped_release release;
+              return build_undirected_graph_from_edges(pairs, num_threads, verbose);
+          },
+          py::arg("edges"),
+          py::arg("num_threads") = std::thread::hardware_concurrency(),
+          py::arg("verbose") = false,
+          "Build an undirected graph from an (E, 2) array of edges between node ids");
+
     // Bind IKC algorithm
+    // The graph is both the working copy peeled by the algorithm and the
+    // original graph used for modularity, so it is only passed in once.
+    // The GIL is released for the whole run and only re-acquired for the
+    // (throttled) progress callback.
     m.def("run_ikc",
-          &iterative_kcore_decomposition,
+          [](const Graph& graph, uint32_t min_k, bool verbose, const py::object& progress_callback,
+             uint32_t progress_stride, double progress_interval_ms, int num_threads,
+             const std::optional<CoreNumbersArray>& core_numbers) {
+              std::unique_ptr<KCoreResult> initial_kcore;
+              if (core_numbers) {
+                  if (static_cast<size_t>(core_numbers->size()) != graph.num_nodes) {
+                      throw py::value_error("core_numbers must have one entry per node");
+                  }
+                  initial_kcore = std::make_unique<KCoreResult>(0);
+                  initial_kcore->core_numbers = to_core_numbers(*core_numbers);
+                  for (uint32_t core : initial_kcore->core_numbers) {
+                      initial_kcore->max_core = std::max(initial_kcore->max_core, core);
+                  }
+              }
+              return run_with_progress(progress_callback, min_k, progress_stride, progress_interval_ms,
+                  [&](const std::function<void(uint32_t)>& callback) {
+                      return iterative_kcore_decomposition(graph, min_k, graph, verbose, callback,
+                                                           num_threads, initial_kcore.get());
+                  });
+          },
           py::arg("graph"),
           py::arg("min_k") = 0,
-          py::arg("orig_graph"),
           py::arg("verbose") = false,
-          py::arg("progress_callback") = nullptr,
-          "Run Iterative K-Core Clustering algorithm");
+          py::arg("progress_callback") = py::none(),
+          py::arg("progress_stride") = 0,
+          py::arg("progress_interval_ms") = 50.0,
+          py::arg("num_threads") = 0,
+          py::arg("core_numbers") = py::none(),
+          "Run Iterative K-Core Clustering algorithm. progress_callback(current_k, initial_k) "
+          "is called at most every progress_interval_ms, after max k drops by progress_stride "
+          "levels (0: about 1% of the range). num_threads <= 0 uses all available threads. "
+          "core_numbers, if given, is the graph's k-core decomposition and skips the first one");
 
     // Bind UpdateStats class
     py::class_<UpdateStats>(m, "UpdateStats")
@@ -70,48 +434,90 @@ PYBIND11_MODULE(_ikc, m) {
                    " recompute_time_ms=" + std::to_string(s.recompute_time_ms) + ">";
         });
 
-    // Bind StreamingIKC class
+    // Bind StreamingIKC class. Methods that update the graph or clustering
+    // run without the GIL; their arguments are converted before it is released.
     py::class_<StreamingIKC>(m, "StreamingIKC")
         .def(py::init<const Graph&, uint32_t>(),
              py::arg("graph"),
              py::arg("min_k") = 0,
              "Initialize streaming IKC with a graph")
         .def("initial_clustering",
-             &StreamingIKC::initial_clustering,
+             [](StreamingIKC& self, bool verbose, const py::object& progress_callback,
+                uint32_t progress_stride, double progress_interval_ms) {
+                 return run_with_progress(progress_callback, self.get_min_k(), progress_stride,
+                                          progress_interval_ms,
+                     [&](const std::function<void(uint32_t)>& callback) {
+                         return self.initial_clustering(verbose, callback);
+                     });
+             },
              py::arg("verbose") = false,
-             py::arg("progress_callback") = nullptr,
-             "Run initial IKC clustering")
+             py::arg("progress_callback") = py::none(),
+             py::arg("progress_stride") = 0,
+             py::arg("progress_interval_ms") = 50.0,
+             "Run initial IKC clustering (progress_callback as in run_ikc)")
         .def("add_edges",
-             &StreamingIKC::add_edges,
+             [](StreamingIKC& self, const py::object& edges, bool recompute, bool verbose) {
+                 auto pairs = to_edge_pairs(edges);
+                 py::gil_scoped_release release;
+                 return self.add_edges(pairs, recompute, verbose);
+             },
              py::arg("edges"),
              py::arg("recompute") = true,
              py::arg("verbose") = false,
-             "Add edges and update clustering incrementally")
+             "Add edges (an (E, 2) array of node ids) and update clustering incrementally")
         .def("add_nodes",
              &StreamingIKC::add_nodes,
              py::arg("nodes"),
              py::arg("recompute") = true,
              py::arg("verbose") = false,
+             py::call_guard<py::gil_scoped_release>(),
              "Add isolated nodes to the graph")
         .def("update",
-             &StreamingIKC::update,
+             [](StreamingIKC& self, const py::object& edges, const std::vector<uint64_t>& nodes,
+                bool verbose) {
+                 auto pairs = to_edge_pairs(edges);
+                 py::gil_scoped_release release;
+                 return self.update(pairs, nodes, verbose);
+             },
              py::arg("edges"),
              py::arg("nodes"),
              py::arg("verbose") = false,
              "Add both edges and nodes in a single update")
+        .def("stage_edges",
+             [](StreamingIKC& self, const py::object& edges) {
+                 self.stage_edges(to_edge_pairs(edges));
+             },
+             py::arg("edges"),
+             "Append edges (an (E, 2) array of node ids) to the pending batch")
+        .def("stage_nodes",
+             &StreamingIKC::stage_nodes,
+             py::arg("nodes"),
+             "Append nodes to the pending batch")
+        .def("validate_update",
+             [](const StreamingIKC& self, const py::object& edges, const std::vector<uint64_t>& nodes) {
+                 self.validate_update(to_edge_pairs(edges), nodes);
+             },
+             py::arg("edges"),
+             py::arg("nodes"),
+             "Raise ValueError if an edge endpoint is neither in the graph nor in nodes")
         .def("begin_batch",
              &StreamingIKC::begin_batch,
              "Enter batch mode - accumulate updates without recomputation")
         .def("commit_batch",
              &StreamingIKC::commit_batch,
              py::arg("verbose") = false,
+             py::call_guard<py::gil_scoped_release>(),
              "Exit batch mode and apply all pending updates")
         .def("get_clusters",
              &StreamingIKC::get_clusters,
              "Get current clustering")
         .def("get_core_numbers",
-             &StreamingIKC::get_core_numbers,
-             "Get current core numbers")
+             [](const StreamingIKC& s) {
+                 // A copy: the core numbers change (and may reallocate) on every update
+                 const auto& cores = s.get_core_numbers();
+                 return py::array_t<uint32_t>(cores.size(), cores.data());
+             },
+             "Get a NumPy copy of the current core numbers, indexed by internal node id")
         .def("get_graph",
              &StreamingIKC::get_graph,
              "Get current graph")
@@ -137,10 +543,34 @@ PYBIND11_MODULE(_ikc, m) {
                    " max_core=" + std::to_string(s.get_max_core()) + ">";
         });
 
+    // Expose k-core decomposition result structure
+    py::class_<KCoreResult>(m, "KCoreResult")
+        .def_property_readonly("core_numbers", [](py::object self) {
+            // Zero-copy, read-only view tied to the lifetime of this result
+            return readonly_array_view(self.cast<const KCoreResult&>().core_numbers, self);
+        })
+        .def_readonly("max_core", &KCoreResult::max_core)
+        .def("__repr__", [](const KCoreResult& r) {
+            return "<KCoreResult nodes=" + std::to_string(r.core_numbers.size()) +
+                   " max_core=" + std::to_string(r.max_core) + ">";
+        });
+
+    // Expose k-core decomposition function
+    m.def("compute_kcore_decomposition",
+          &compute_kcore_decomposition,
+          py::arg("graph"),
+          py::arg("num_threads") = 0,
+          py::call_guard<py::gil_scoped_release>(),
+          "Compute k-core decomposition and return core numbers "
+          "(num_threads <= 0 uses all available threads)");
+
     // Bind MaximalKCoreResult class
     py::class_<ikc::MaximalKCoreResult>(m, "MaximalKCoreResult")
         .def(py::init<>())
-        .def_readonly("nodes", &ikc::MaximalKCoreResult::nodes)
+        // Read-only view of the node IDs, without copying them
+        .def_property_readonly("nodes", [](py::object self) {
+            return readonly_array_view(self.cast<const ikc::MaximalKCoreResult&>().nodes, self);
+        })
         .def_readonly("k_value", &ikc::MaximalKCoreResult::k_value)
         .def_readonly("size", &ikc::MaximalKCoreResult::size)
         .def_readonly("found", &ikc::MaximalKCoreResult::found)
@@ -158,27 +588,99 @@ PYBIND11_MODULE(_ikc, m) {
           py::overload_cast<const Graph&, uint64_t>(&ikc::find_maximal_kcore),
           py::arg("graph"),
           py::arg("query_node"),
+          py::call_guard<py::gil_scoped_release>(),
           "Find maximal k-core containing a query node");
 
     m.def("find_maximal_kcore",
-          py::overload_cast<const Graph&, uint64_t, const std::vector<uint32_t>&>(&ikc::find_maximal_kcore),
+          [](const Graph& graph, uint64_t query_node, const CoreNumbersArray& core_numbers) {
+              std::vector<uint32_t> cores = to_core_numbers(graph, core_numbers);
+              py::gil_scoped_release release;
+              return ikc::find_maximal_kcore(graph, query_node, cores);
+          },
           py::arg("graph"),
           py::arg("query_node"),
           py::arg("core_numbers"),
           "Find maximal k-core containing a query node with cached core numbers");
 
-    // Expose k-core decomposition result structure
-    py::class_<KCoreResult>(m, "KCoreResult")
-        .def_readonly("core_numbers", &KCoreResult::core_numbers)
-        .def_readonly("max_core", &KCoreResult::max_core)
-        .def("__repr__", [](const KCoreResult& r) {
-            return "<KCoreResult nodes=" + std::to_string(r.core_numbers.size()) +
-                   " max_core=" + std::to_string(r.max_core) + ">";
+    m.def("find_maximal_kcore",
+          [](const Graph& graph, uint64_t query_node, const KCoreResult& kcore) {
+              check_core_numbers(graph, kcore.core_numbers.size());
+              py::gil_scoped_release release;
+              return ikc::find_maximal_kcore(graph, query_node, kcore.core_numbers);
+          },
+          py::arg("graph"),
+          py::arg("query_node"),
+          py::arg("kcore"),
+          "Find maximal k-core containing a query node with a cached k-core decomposition");
+
+    // Bind KCoreComponentResult class
+    py::class_<ikc::KCoreComponentResult>(m, "KCoreComponentResult")
+        .def(py::init<>())
+        // Read-only view of the node IDs, without copying them
+        .def_property_readonly("nodes", [](py::object self) {
+            return readonly_array_view(self.cast<const ikc::KCoreComponentResult&>().nodes, self);
+        })
+        .def_readonly("k_value", &ikc::KCoreComponentResult::k_value)
+        .def_readonly("size", &ikc::KCoreComponentResult::size)
+        .def_readonly("found", &ikc::KCoreComponentResult::found)
+        .def("__repr__", [](const ikc::KCoreComponentResult& r) -> std::string {
+            if (r.found) {
+                return "<KCoreComponentResult found=True k=" + std::to_string(r.k_value) +
+                       " size=" + std::to_string(r.size) + ">";
+            } else {
+                return std::string("<KCoreComponentResult found=False>");
+            }
         });
 
-    // Expose k-core decomposition function
-    m.def("compute_kcore_decomposition",
-          &compute_kcore_decomposition,
+    // Bind smallest k-core component search functions
+    m.def("find_smallest_kcore_component",
+          py::overload_cast<const Graph&, uint32_t>(&ikc::find_smallest_kcore_component),
+          py::arg("graph"),
+          py::arg("k"),
+          py::call_guard<py::gil_scoped_release>(),
+          "Find the smallest connected component of a graph's k-core");
+
+    m.def("find_smallest_kcore_component",
+          [](const Graph& graph, uint32_t k, const CoreNumbersArray& core_numbers) {
+              std::vector<uint32_t> cores = to_core_numbers(graph, core_numbers);
+              py::gil_scoped_release release;
+              return ikc::find_smallest_kcore_component(graph, k, cores);
+          },
+          py::arg("graph"),
+          py::arg("k"),
+          py::arg("core_numbers"),
+          "Find the smallest connected component of a graph's k-core with cached core numbers");
+
+    m.def("find_smallest_kcore_component",
+          [](const Graph& graph, uint32_t k, const KCoreResult& kcore) {
+              check_core_numbers(graph, kcore.core_numbers.size());
+              py::gil_scoped_release release;
+              return ikc::find_smallest_kcore_component(graph, k, kcore.core_numbers);
+          },
+          py::arg("graph"),
+          py::arg("k"),
+          py::arg("kcore"),
+          "Find the smallest connected component of a graph's k-core with a cached k-core decomposition");
+
+    m.def("run_maximal_kcores",
+          [](const Graph& graph,
+             py::array_t<uint64_t, py::array::c_style | py::array::forcecast> query_nodes,
+             const CoreNumbersArray& core_numbers) {
+              return run_maximal_kcores(graph, query_nodes, to_core_numbers(core_numbers));
+          },
+          py::arg("graph"),
+          py::arg("query_nodes"),
+          py::arg("core_numbers"),
+          "Find maximal k-cores for a batch of query nodes with cached core numbers");
+
+    m.def("run_maximal_kcores",
+          [](const Graph& graph,
+             py::array_t<uint64_t, py::array::c_style | py::array::forcecast> query_nodes,
+             const KCoreResult& kcore) {
+              return run_maximal_kcores(graph, query_nodes, kcore.core_numbers);
+          },
           py::arg("graph"),
-          "Compute k-core decomposition and return core numbers");
+          py::arg("query_nodes"),
+          py::arg("kcore"),
+          "Find maximal k-cores for a batch of query nodes with a cached k-core decomposition");
 }
@@ -1,15 +1,58 @@
 """
 Python wrapper for the Iterative K-Core Clustering (IKC) C++ implementation.
 """
-from pathlib import Path
-from typing import Optional, List, Tuple
+import functools
+import os
+from typing import Optional, List, Sequence, Tuple
+import numpy as np
 import _ikc
 
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
+# Column names of ClusterResult.data, in order
+_DATA_NAMES = ('node_id', 'cluster_id', 'k_value', 'modularity')
+
+# Shared, read-only result of ClusterResult.data when there are no clusters
+_EMPTY_DATA = np.rec.fromarrays(
+    [np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32),
+     np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)],
+    names=list(_DATA_NAMES))
+_EMPTY_DATA.flags.writeable = False
+
+# Minimum number of seconds between progress bar redraws
+PROGRESS_REFRESH_INTERVAL = 0.1
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tqdm():
+    """
+    Import tqdm on first use of a progress bar, so that ``import ikc`` does
+    not pay for it.
+
+    Returns:
+        The tqdm class, or None if tqdm is not installed
+    """
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return None
+    return tqdm
+
+
+def _make_progress_callback(pbar, min_k: int):
+    """
+    Build the progress callback that drives a tqdm progress bar.
+
+    The C++ side rate-limits the calls and passes the initial max k along,
+    so the bar range, initial_k (0%) to min_k (100%), is known on every call.
+    """
+    def callback(current_k: int, initial_k: int):
+        pbar.total = max(1, initial_k - min_k)
+        # How far we've gone from initial_k toward min_k; the final round
+        # can drop below min_k, which still counts as 100%
+        pbar.n = min(initial_k - current_k, pbar.total)
+        pbar.set_postfix_str(f"current_k={current_k}", refresh=False)
+        pbar.refresh()
+
+    return callback
 
 
 class ClusterResult:
@@ -17,6 +60,8 @@ class ClusterResult:
     Represents clustering results from the IKC algorithm.
     """
 
+    __slots__ = ('clusters', '_columns', '_data', '_num_nodes', '_num_clusters')
+
     def __init__(self, clusters: List[_ikc.Cluster]):
         """
         Initialize ClusterResult.
@@ -25,24 +70,57 @@ class ClusterResult:
             clusters: List of Cluster objects from C++
         """
         self.clusters = clusters
+        self._columns = None
         self._data = None
+        self._num_nodes = sum(map(len, clusters))
+        self._num_clusters = len(clusters)
+
+    def _get_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the (node_id, cluster_id, k_value, modularity) columns as separate
+        contiguous arrays, one entry per clustered node. Built once and cached.
+        """
+        if not self._num_clusters:
+            return tuple(_EMPTY_DATA[name] for name in _DATA_NAMES)
+        if self._columns is None:
+            self._columns = _ikc.clusters_to_arrays(self.clusters)
+        return self._columns
 
     @property
-    def data(self) -> List[Tuple[int, int, int, float]]:
+    def data(self) -> np.recarray:
         """
-        Get clustering results as a list of tuples.
+        Get clustering results as a NumPy record array.
+
+        Each row is a (node_id, cluster_id, k_value, modularity) record; the
+        columns are also accessible by name, e.g. ``result.data.node_id``.
 
         Returns:
-            List of (node_id, cluster_id, k_value, modularity) tuples
+            Record array with one row per clustered node
         """
+        if not self._num_clusters:
+            return _EMPTY_DATA
         if self._data is None:
-            self._data = []
-            for cluster_idx, cluster in enumerate(self.clusters, start=1):
-                for node_id in cluster.nodes:
-                    self._data.append((node_id, cluster_idx, cluster.k_value, cluster.modularity))
+            self._data = np.rec.fromarrays(self._get_columns(), names=list(_DATA_NAMES))
         return self._data
 
-    def save(self, filename: str, tsv: bool = False):
+    def to_dataframe(self):
+        """
+        Get clustering results as a pandas DataFrame, built in memory from
+        the same columns as :attr:`data`.
+
+        Requires pandas, which is not otherwise a dependency of this package.
+
+        Returns:
+            DataFrame with node_id, cluster_id, k_value and modularity columns
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("to_dataframe() requires pandas: pip install pandas") from None
+
+        return pd.DataFrame(dict(zip(_DATA_NAMES, self._get_columns())), columns=list(_DATA_NAMES))
+
+    def save(self, filename: str, tsv: bool = False, format: Optional[str] = None):
         """
         Save clustering results to a file.
 
@@ -50,41 +128,52 @@ class ClusterResult:
             filename: Output file path
             tsv: If True, save as TSV with only node_id and cluster_id (no header)
                  If False, save as CSV with all columns
+            format: Output format, one of 'csv', 'tsv' or 'parquet'. Overrides
+                 ``tsv`` when given. Parquet keeps all columns and requires pyarrow.
         """
-        with open(filename, 'w') as f:
-            if not tsv:
-                # CSV format with header
-                f.write("node_id,cluster_id,k_value,modularity\n")
-
-            for cluster_idx, cluster in enumerate(self.clusters, start=1):
-                for node_id in cluster.nodes:
-                    if tsv:
-                        # TSV format: node_id<tab>cluster_id
-                        f.write(f"{node_id}\t{cluster_idx}\n")
-                    else:
-                        # CSV format: all columns
-                        f.write(f"{node_id},{cluster_idx},{cluster.k_value},{cluster.modularity}\n")
+        if format is None:
+            format = 'tsv' if tsv else 'csv'
+        if format not in ('csv', 'tsv', 'parquet'):
+            raise ValueError(f"Unknown format {format!r}; expected 'csv', 'tsv' or 'parquet'")
+
+        if format == 'parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Saving as Parquet requires pyarrow: pip install pyarrow") from None
+
+            table = pa.table(dict(zip(_DATA_NAMES, self._get_columns())))
+            pq.write_table(table, filename, compression='zstd')
+        elif format == 'tsv':
+            # TSV format: node_id<tab>cluster_id, formatted and written in C++
+            _ikc.write_clusters_tsv(os.fspath(filename), self.clusters)
+        else:
+            # CSV format with header: all columns, formatted and written in C++
+            _ikc.write_clusters_csv(os.fspath(filename), self.clusters)
 
         print(f"Results saved to: {filename}")
 
     def __repr__(self):
-        n_clusters = len(self.clusters)
-        n_nodes = sum(len(cluster.nodes) for cluster in self.clusters)
-        return f"ClusterResult(nodes={n_nodes}, clusters={n_clusters})"
+        return f"ClusterResult(nodes={self._num_nodes}, clusters={self._num_clusters})"
 
     def __len__(self):
         """Return number of nodes in the clustering."""
-        return sum(len(cluster.nodes) for cluster in self.clusters)
+        return self._num_nodes
+
+    def __iter__(self):
+        """Iterate over (node_id, cluster_id, k_value, modularity) rows as tuples."""
+        return zip(*(column.tolist() for column in self._get_columns()))
 
     @property
     def num_clusters(self):
         """Return the number of clusters."""
-        return len(self.clusters)
+        return self._num_clusters
 
     @property
     def num_nodes(self):
         """Return the number of nodes."""
-        return sum(len(cluster.nodes) for cluster in self.clusters)
+        return self._num_nodes
 
 
 class Graph:
@@ -92,7 +181,10 @@ class Graph:
     Represents a graph for IKC clustering.
     """
 
-    def __init__(self, graph_file: str, num_threads: Optional[int] = None, verbose: bool = False):
+    __slots__ = ('graph_file', '_graph', '_kcore_cache', 'num_nodes', 'num_edges')
+
+    def __init__(self, graph_file: str, num_threads: Optional[int] = None, verbose: bool = False,
+                 mmap: bool = True):
         """
         Initialize Graph from a TSV edge list file.
 
@@ -100,49 +192,70 @@ class Graph:
             graph_file: Path to the graph edge list file (TSV format)
             num_threads: Number of threads to use for loading (default: hardware concurrency)
             verbose: If True, print loading progress
-        """
-        self.graph_file = str(Path(graph_file).resolve())
+            mmap: If True (default), memory-map the file for parsing; otherwise
+                read it into memory first
 
-        if not Path(self.graph_file).exists():
-            raise FileNotFoundError(f"Graph file not found: {self.graph_file}")
+        Raises:
+            FileNotFoundError: If the graph file does not exist
+        """
+        # abspath is a pure string operation; a missing or unreadable file is
+        # reported by the loader itself (FileNotFoundError / OSError)
+        self.graph_file = os.path.abspath(os.fspath(graph_file))
 
         # Load graph using C++ binding
         if num_threads is None:
-            self._graph = _ikc.load_graph(self.graph_file, verbose=verbose)
+            self._graph = _ikc.load_graph(self.graph_file, verbose=verbose, mmap=mmap)
         else:
-            self._graph = _ikc.load_graph(self.graph_file, num_threads, verbose)
+            self._graph = _ikc.load_graph(self.graph_file, num_threads, verbose, mmap)
 
-    @property
-    def num_nodes(self):
-        """Number of nodes in the graph."""
-        return self._graph.num_nodes
+        # The graph is immutable once loaded, so its size is read once
+        self.num_nodes = int(self._graph.num_nodes)
+        self.num_edges = int(self._graph.num_edges)
+
+        # k-core decomposition, computed on first use
+        self._kcore_cache = None
 
     @property
-    def num_edges(self):
-        """Number of edges in the graph."""
-        return self._graph.num_edges
+    def kcore_decomposition(self):
+        """
+        Cached k-core decomposition of the graph.
+
+        The decomposition is computed on first access and reused afterwards.
+        Call invalidate_kcore() to force it to be recomputed.
+
+        Returns:
+            KCoreResult object with core_numbers (read-only NumPy array) and max_core (int)
+        """
+        if self._kcore_cache is None:
+            self._kcore_cache = _ikc.compute_kcore_decomposition(self._graph)
+        return self._kcore_cache
+
+    def invalidate_kcore(self):
+        """Drop the cached k-core decomposition."""
+        self._kcore_cache = None
 
     def compute_kcore_decomposition(self):
         """
         Compute k-core decomposition for the graph.
 
         This returns core numbers for all nodes, which can be reused for multiple
-        minimum k-core searches to avoid redundant computation.
+        k-core searches to avoid redundant computation. The result is
+        cached, so repeated calls do not redo the decomposition.
 
         Returns:
-            KCoreResult object with core_numbers (list) and max_core (int)
+            KCoreResult object with core_numbers (read-only NumPy array) and max_core (int)
 
         Example:
             >>> g = ikc.load_graph('network.tsv')
             >>> kcore = g.compute_kcore_decomposition()
             >>> print(f"Max core: {kcore.max_core}")
             >>> # Now use cached core numbers for multiple searches
-            >>> result1 = g.find_minimum_kcore(k=5, core_numbers=kcore.core_numbers)
-            >>> result2 = g.find_minimum_kcore(k=10, core_numbers=kcore.core_numbers)
+            >>> result1 = g.find_smallest_kcore_component(k=5, core_numbers=kcore.core_numbers)
+            >>> result2 = g.find_smallest_kcore_component(k=10, core_numbers=kcore.core_numbers)
         """
-        return _ikc.compute_kcore_decomposition(self._graph)
+        return self.kcore_decomposition
 
-    def find_maximal_kcore(self, query_node: int, core_numbers: Optional[List[int]] = None):
+    def find_maximal_kcore(self, query_node: int, core_numbers: Optional[Sequence[int]] = None):
         """
         Find the maximal k-core containing a query node.
 
@@ -155,30 +268,80 @@ class Graph:
         Args:
             query_node: The node whose maximal k-core we want to find
             core_numbers: Optional pre-computed core numbers (from compute_kcore_decomposition).
-                         If provided, avoids redundant k-core decomposition.
+                         If omitted, the graph's cached k-core decomposition is used.
 
         Returns:
             Dictionary with keys:
-                - 'nodes': List of node IDs in the maximal k-core
+                - 'nodes': NumPy array of node IDs in the maximal k-core
                 - 'k': The core number (maximal k value)
                 - 'size': Number of nodes in the k-core
             Returns None if node doesn't exist
 
+        Raises:
+            ValueError: If core_numbers doesn't have one entry per node
+
         Example:
             >>> g = ikc.load_graph('network.tsv')
             >>> result = g.find_maximal_kcore(query_node=42)
             >>> if result:
             ...     print(f"Node 42 is in a {result['k']}-core with {result['size']} nodes")
 
-            >>> # Reuse core decomposition for multiple queries (recommended!)
-            >>> kcore = g.compute_kcore_decomposition()
-            >>> result1 = g.find_maximal_kcore(42, core_numbers=kcore.core_numbers)
-            >>> result2 = g.find_maximal_kcore(100, core_numbers=kcore.core_numbers)
+            >>> # Later queries reuse the cached decomposition
+            >>> result1 = g.find_maximal_kcore(42)
+            >>> result2 = g.find_maximal_kcore(100)
         """
         if core_numbers is not None:
             result = _ikc.find_maximal_kcore(self._graph, query_node, core_numbers)
         else:
-            result = _ikc.find_maximal_kcore(self._graph, query_node)
+            result = _ikc.find_maximal_kcore(self._graph, query_node, self.kcore_decomposition)
+
+        if result.found:
+            return {
+                'nodes': result.nodes,
+                'k': result.k_value,
+                'size': result.size
+            }
+        return None
+
+    def find_smallest_kcore_component(self, k: int, core_numbers: Optional[Sequence[int]] = None):
+        """
+        Find the smallest connected component of the graph's k-core.
+
+        Each connected component of the k-core (the nodes with core number >= k)
+        is a connected subgraph in which every node has degree >= k; this returns
+        the one with the fewest nodes. It is not necessarily the smallest such
+        subgraph: a component can contain a smaller connected k-core, e.g. a
+        triangle joined by one edge to a 4-cycle is a single 2-core component
+        of 7 nodes, although the triangle alone is a 2-core. Only the core
+        numbers are thresholded, so any number of k values can be searched with
+        a single k-core decomposition.
+
+        Args:
+            k: Minimum degree of the k-core
+            core_numbers: Optional pre-computed core numbers (from compute_kcore_decomposition).
+                         If omitted, the graph's cached k-core decomposition is used.
+
+        Returns:
+            Dictionary with keys:
+                - 'nodes': NumPy array of node IDs in the component
+                - 'k': The requested k
+                - 'size': Number of nodes in the component
+            Returns None if the graph has no k-core
+
+        Raises:
+            ValueError: If core_numbers doesn't have one entry per node
+
+        Example:
+            >>> g = ikc.load_graph('network.tsv')
+            >>> for k in [5, 10, 15, 20]:
+            ...     result = g.find_smallest_kcore_component(k=k)
+            ...     if result:
+            ...         print(f"Smallest {k}-core component has {result['size']} nodes")
+        """
+        if core_numbers is not None:
+            result = _ikc.find_smallest_kcore_component(self._graph, k, core_numbers)
+        else:
+            result = _ikc.find_smallest_kcore_component(self._graph, k, self.kcore_decomposition)
 
         if result.found:
             return {
@@ -188,59 +351,102 @@ class Graph:
             }
         return None
 
+    def find_maximal_kcores(self, query_nodes: Sequence[int],
+                            core_numbers: Optional[Sequence[int]] = None) -> List[Optional[dict]]:
+        """
+        Find the maximal k-cores of several query nodes in a single call.
+
+        Equivalent to calling find_maximal_kcore() for each node, but all
+        searches run inside one C++ call.
+
+        Args:
+            query_nodes: The nodes whose maximal k-cores we want to find
+            core_numbers: Optional pre-computed core numbers (from compute_kcore_decomposition).
+                         If omitted, the graph's cached k-core decomposition is used.
+
+        Returns:
+            List with one entry per query node, in order: a dictionary with
+            'nodes' (NumPy array of node IDs), 'k' and 'size' keys as returned
+            by find_maximal_kcore(), or None if the node doesn't exist
+
+        Raises:
+            ValueError: If core_numbers doesn't have one entry per node
+
+        Example:
+            >>> g = ikc.load_graph('network.tsv')
+            >>> for node, result in zip(nodes, g.find_maximal_kcores(nodes)):
+            ...     if result:
+            ...         print(f"Node {node}: {result['k']}-core with {result['size']} nodes")
+        """
+        queries = np.asarray(query_nodes, dtype=np.uint64)
+        if core_numbers is None:
+            core_numbers = self.kcore_decomposition
+        k_values, sizes, offsets, nodes = _ikc.run_maximal_kcores(self._graph, queries, core_numbers)
+
+        results = []
+        for i in range(len(queries)):
+            if sizes[i] == 0:
+                results.append(None)
+                continue
+            results.append({
+                'nodes': nodes[offsets[i]:offsets[i + 1]],
+                'k': int(k_values[i]),
+                'size': int(sizes[i])
+            })
+        return results
+
     def ikc(self,
             min_k: int = 0,
             verbose: bool = False,
-            progress_bar: bool = False) -> ClusterResult:
+            progress_bar: bool = False,
+            num_threads: Optional[int] = None,
+            core_numbers: Optional[Sequence[int]] = None) -> ClusterResult:
         """
         Run the Iterative K-Core Clustering algorithm.
 
+        The first round of the algorithm peels the whole graph, so it reuses the
+        graph's cached k-core decomposition (computing and caching it if needed).
+        Back-to-back runs with different min_k values only decompose the graph once.
+
         Args:
             min_k: Minimum k value for valid clusters (default: 0)
             verbose: If True, print algorithm progress
             progress_bar: If True, display tqdm progress bar tracking k-core decomposition
                          from initial max k (0%) to min_k (100%)
+            num_threads: Number of threads for the k-core decompositions of large graphs
+                         (default: hardware concurrency)
+            core_numbers: Optional pre-computed core numbers (from compute_kcore_decomposition).
+                         If omitted, the graph's cached k-core decomposition is used.
 
         Returns:
             ClusterResult object containing the clustering results
         """
+        if core_numbers is None:
+            if self._kcore_cache is None:
+                self._kcore_cache = _ikc.compute_kcore_decomposition(self._graph, num_threads or 0)
+            core_numbers = self._kcore_cache.core_numbers
+
         # Setup progress bar if requested
         pbar = None
-        initial_k = [None]  # Use list to allow modification in nested function
-
-        def progress_callback(current_k: int):
-            """Callback function to update progress bar"""
-            if pbar is None:
-                return
-
-            # Set initial k on first call
-            if initial_k[0] is None:
-                initial_k[0] = current_k
-                # Set up progress bar range from initial_k to min_k
-                pbar.total = max(1, initial_k[0] - min_k)
-                pbar.n = 0
-                pbar.refresh()
-            else:
-                # Calculate progress: how far we've gone from initial_k toward min_k
-                progress = initial_k[0] - current_k
-                pbar.n = progress
-                pbar.set_postfix({'current_k': current_k})
-                pbar.refresh()
 
         if progress_bar:
-            if not TQDM_AVAILABLE:
+            tqdm = _get_tqdm()
+            if tqdm is None:
                 import warnings
                 warnings.warn("tqdm is not installed. Install it with 'pip install tqdm' to use progress_bar feature.")
                 callback = None
             else:
-                pbar = tqdm(total=1, desc="IKC Progress", unit="k-core levels")
-                callback = progress_callback
+                pbar = tqdm(total=1, desc="IKC Progress", unit="k-core levels",
+                            mininterval=PROGRESS_REFRESH_INTERVAL)
+                callback = _make_progress_callback(pbar, min_k)
         else:
             callback = None
 
         try:
             # Run IKC algorithm using C++ binding
-            clusters = _ikc.run_ikc(self._graph, min_k, self._graph, verbose, callback)
+            clusters = _ikc.run_ikc(self._graph, min_k, verbose, callback,
+                                    progress_interval_ms=PROGRESS_REFRESH_INTERVAL * 1000,
+                                    num_threads=num_threads or 0, core_numbers=core_numbers)
         finally:
             if pbar is not None:
                 pbar.close()
@@ -251,14 +457,19 @@ class Graph:
         return f"Graph(file='{self.graph_file}', nodes={self.num_nodes}, edges={self.num_edges})"
 
 
-def load_graph(graph_file: str, num_threads: Optional[int] = None, verbose: bool = False) -> Graph:
+def load_graph(graph_file: str, num_threads: Optional[int] = None, verbose: bool = False,
+               mmap: bool = True) -> Graph:
     """
     Load a graph from a TSV edge list file.
 
+    The file is split into one byte range per thread and parsed in parallel.
+
     Args:
         graph_file: Path to the graph edge list file (TSV format)
         num_threads: Number of threads to use for loading (default: hardware concurrency)
         verbose: If True, print loading progress
+        mmap: If True (default), memory-map the file for parsing; otherwise
+            read it into memory first
 
     Returns:
         Graph object ready for clustering
@@ -269,7 +480,7 @@ def load_graph(graph_file: str, num_threads: Optional[int] = None, verbose: bool
         >>> c = g.ikc(10)
         >>> c.save('out.tsv', tsv=True)
     """
-    return Graph(graph_file, num_threads, verbose)
+    return Graph(graph_file, num_threads, verbose, mmap)
 
 
 class StreamingGraph:
@@ -277,7 +488,11 @@ class StreamingGraph:
     Graph with support for incremental IKC updates.
     """
 
-    def __init__(self, graph_file: str, num_threads: Optional[int] = None, verbose: bool = False):
+    __slots__ = ('graph_file', '_graph', '_streaming_ikc', '_current_result', '_min_k',
+                 '_core_cache')
+
+    def __init__(self, graph_file: str, num_threads: Optional[int] = None, verbose: bool = False,
+                 mmap: bool = True):
         """
         Initialize StreamingGraph from a TSV edge list file.
 
@@ -285,22 +500,64 @@ class StreamingGraph:
             graph_file: Path to the graph edge list file (TSV format)
             num_threads: Number of threads to use for loading (default: hardware concurrency)
             verbose: If True, print loading progress
-        """
-        self.graph_file = str(Path(graph_file).resolve())
+            mmap: If True (default), memory-map the file for parsing; otherwise
+                read it into memory first
 
-        if not Path(self.graph_file).exists():
-            raise FileNotFoundError(f"Graph file not found: {self.graph_file}")
+        Raises:
+            FileNotFoundError: If the graph file does not exist
+        """
+        # abspath is a pure string operation; a missing or unreadable file is
+        # reported by the loader itself (FileNotFoundError / OSError)
+        self.graph_file = os.path.abspath(os.fspath(graph_file))
 
         # Load graph using C++ binding
         if num_threads is None:
-            self._graph = _ikc.load_graph(self.graph_file, verbose=verbose)
+            self._graph = _ikc.load_graph(self.graph_file, verbose=verbose, mmap=mmap)
         else:
-            self._graph = _ikc.load_graph(self.graph_file, num_threads, verbose)
+            self._graph = _ikc.load_graph(self.graph_file, num_threads, verbose, mmap)
 
         # StreamingIKC instance (created after initial clustering)
         self._streaming_ikc = None
         self._min_k = None
         self._current_result = None
+        self._core_cache = None
+
+    @classmethod
+    def from_edges(cls, edges, num_threads: Optional[int] = None,
+                   verbose: bool = False) -> 'StreamingGraph':
+        """
+        Create a StreamingGraph from an in-memory edge list, without a file.
+
+        Args:
+            edges: Edges between node IDs, as a NumPy array (or anything NumPy can
+                convert to one) of shape (num_edges, 2); arrays of dtype uint64 are
+                passed without copying
+            num_threads: Number of threads to use for building the graph
+                (default: hardware concurrency)
+            verbose: If True, print construction progress
+
+        Returns:
+            StreamingGraph whose graph_file is None
+
+        Raises:
+            TypeError: If edges are not integer node IDs
+            ValueError: If a node ID is negative
+
+        Example:
+            >>> g = ikc.StreamingGraph.from_edges([(0, 1), (1, 2), (2, 0)])
+            >>> result = g.ikc(min_k=2)
+        """
+        self = cls.__new__(cls)
+        self.graph_file = None
+        if num_threads is None:
+            self._graph = _ikc.graph_from_edges(edges, verbose=verbose)
+        else:
+            self._graph = _ikc.graph_from_edges(edges, num_threads, verbose)
+        self._streaming_ikc = None
+        self._min_k = None
+        self._current_result = None
+        self._core_cache = None
+        return self
 
     @property
     def num_nodes(self):
@@ -333,32 +590,17 @@ class StreamingGraph:
         """
         # Setup progress bar if requested
         pbar = None
-        initial_k = [None]
-
-        def progress_callback(current_k: int):
-            """Callback function to update progress bar"""
-            if pbar is None:
-                return
-
-            if initial_k[0] is None:
-                initial_k[0] = current_k
-                pbar.total = max(1, initial_k[0] - min_k)
-                pbar.n = 0
-                pbar.refresh()
-            else:
-                progress = initial_k[0] - current_k
-                pbar.n = progress
-                pbar.set_postfix({'current_k': current_k})
-                pbar.refresh()
 
         if progress_bar:
-            if not TQDM_AVAILABLE:
+            tqdm = _get_tqdm()
+            if tqdm is None:
                 import warnings
                 warnings.warn("tqdm is not installed. Install it with 'pip install tqdm' to use progress_bar feature.")
                 callback = None
             else:
-                pbar = tqdm(total=1, desc="IKC Progress", unit="k-core levels")
-                callback = progress_callback
+                pbar = tqdm(total=1, desc="IKC Progress", unit="k-core levels",
+                            mininterval=PROGRESS_REFRESH_INTERVAL)
+                callback = _make_progress_callback(pbar, min_k)
         else:
             callback = None
 
@@ -366,9 +608,11 @@ class StreamingGraph:
             # Initialize streaming IKC
             self._min_k = min_k
             self._streaming_ikc = _ikc.StreamingIKC(self._graph, min_k)
+            self._core_cache = None
 
             # Run initial clustering
-            clusters = self._streaming_ikc.initial_clustering(verbose, callback)
+            clusters = self._streaming_ikc.initial_clustering(
+                verbose, callback, progress_interval_ms=PROGRESS_REFRESH_INTERVAL * 1000)
             self._current_result = ClusterResult(clusters)
 
         finally:
@@ -382,7 +626,8 @@ class StreamingGraph:
         Add new edges to the graph and update clustering incrementally.
 
         Args:
-            edges: List of (node_id, node_id) tuples representing edges
+            edges: List of (node_id, node_id) tuples, or an integer array of
+                shape (num_edges, 2); arrays of dtype uint64 are passed without copying
             verbose: If True, print update progress
 
         Returns:
@@ -390,11 +635,19 @@ class StreamingGraph:
 
         Raises:
             RuntimeError: If ikc() hasn't been called yet
+            TypeError: If edges are not integer node IDs
+            ValueError: If a node ID is negative
         """
         if self._streaming_ikc is None:
             raise RuntimeError("Must call ikc() before add_edges(). Streaming state not initialized.")
 
+        if self._streaming_ikc.is_batch_mode():
+            # Only staged; the clustering is unchanged until commit_batch()
+            self._streaming_ikc.stage_edges(edges)
+            return self._current_result
+
         clusters = self._streaming_ikc.add_edges(edges, recompute=True, verbose=verbose)
+        self._core_cache = None
         self._current_result = ClusterResult(clusters)
         return self._current_result
 
@@ -415,7 +668,12 @@ class StreamingGraph:
         if self._streaming_ikc is None:
             raise RuntimeError("Must call ikc() before add_nodes(). Streaming state not initialized.")
 
+        if self._streaming_ikc.is_batch_mode():
+            self._streaming_ikc.stage_nodes(nodes)
+            return self._current_result
+
         clusters = self._streaming_ikc.add_nodes(nodes, recompute=True, verbose=verbose)
+        self._core_cache = None
         self._current_result = ClusterResult(clusters)
         return self._current_result
 
@@ -432,7 +690,8 @@ class StreamingGraph:
         or be included in new_nodes.
 
         Args:
-            new_edges: List of (node_id, node_id) tuples (optional)
+            new_edges: List of (node_id, node_id) tuples, or an integer array of
+                shape (num_edges, 2) (optional)
             new_nodes: List of node IDs (optional)
             verbose: If True, print update progress
 
@@ -441,7 +700,9 @@ class StreamingGraph:
 
         Raises:
             RuntimeError: If ikc() hasn't been called yet
-            ValueError: If an edge references a node that doesn't exist and isn't in new_nodes
+            TypeError: If new_edges are not integer node IDs
+            ValueError: If a node ID is negative, or an edge references a node that
+                doesn't exist and isn't in new_nodes
 
         Example:
             # Correct: all edge nodes are included
@@ -457,7 +718,15 @@ class StreamingGraph:
         nodes = new_nodes if new_nodes is not None else []
 
         try:
+            if self._streaming_ikc.is_batch_mode():
+                # Checked now, but only staged until commit_batch()
+                self._streaming_ikc.validate_update(edges, nodes)
+                self._streaming_ikc.stage_nodes(nodes)
+                self._streaming_ikc.stage_edges(edges)
+                return self._current_result
+
             clusters = self._streaming_ikc.update(edges, nodes, verbose)
+            self._core_cache = None
             self._current_result = ClusterResult(clusters)
             return self._current_result
         except Exception as e:
@@ -471,7 +740,9 @@ class StreamingGraph:
         """
         Enter batch mode - accumulate updates without recomputation.
 
-        Use commit_batch() to apply all pending updates at once.
+        Use commit_batch() to apply all pending updates at once. Until then,
+        add_edges(), add_nodes() and update() only stage their input and
+        return the current (unchanged) clustering.
 
         Raises:
             RuntimeError: If ikc() hasn't been called yet
@@ -498,6 +769,7 @@ class StreamingGraph:
             raise RuntimeError("Must call ikc() before commit_batch(). Streaming state not initialized.")
 
         clusters = self._streaming_ikc.commit_batch(verbose)
+        self._core_cache = None
         self._current_result = ClusterResult(clusters)
         return self._current_result
 
@@ -542,6 +814,26 @@ class StreamingGraph:
             return None
         return self._streaming_ikc.get_max_core()
 
+    @property
+    def core_numbers(self) -> Optional[np.ndarray]:
+        """
+        Current core numbers, kept up to date by the incremental updates.
+
+        core_numbers[i] is the core number of the i-th node: the loaded nodes in
+        ascending ID order, then added nodes in the order they were added. The
+        array is copied out once and cached until the next update.
+
+        Returns:
+            Read-only NumPy array of core numbers, or None if ikc() hasn't been called yet
+        """
+        if self._streaming_ikc is None:
+            return None
+        if self._core_cache is None:
+            core_numbers = self._streaming_ikc.get_core_numbers()
+            core_numbers.setflags(write=False)
+            self._core_cache = core_numbers
+        return self._core_cache
+
     @property
     def is_batch_mode(self) -> bool:
         """Check if currently in batch mode."""
@@ -551,7 +843,7 @@ class StreamingGraph:
 
     def __repr__(self):
         if self._streaming_ikc is not None:
-            return f"StreamingGraph(file='{self.graph_file}', nodes={self.num_nodes}, edges={self.num_edges}, clusters={len(self._current_result.clusters) if self._current_result else 0})"
+            return f"StreamingGraph(file='{self.graph_file}', nodes={self.num_nodes}, edges={self.num_edges}, clusters={self._current_result.num_clusters if self._current_result else 0})"
         return f"StreamingGraph(file='{self.graph_file}', nodes={self.num_nodes}, edges={self.num_edges})"
 
 
@@ -8,23 +8,30 @@ class get_pybind_include:
         import pybind11
         return pybind11.get_include()
 
+# Optimize for the build machine's CPU; set IKC_PORTABLE=1 when building
+# binaries (e.g. wheels) that have to run on other machines
+extra_compile_args = ['-std=c++17', '-O3', '-funroll-loops', '-flto']
+extra_link_args = ['-flto']
+if os.environ.get('IKC_PORTABLE', '0') in ('', '0'):
+    extra_compile_args.append('-march=native')
+
 # Configure OpenMP flags based on platform
-extra_compile_args = ['-std=c++17', '-O3']
-extra_link_args = []
 include_dirs = [str(get_pybind_include()), 'lib']
 library_dirs = []
 libraries = []
 
 if sys.platform == 'darwin':
-    # macOS - use libomp from Homebrew
-    omp_prefix = '/usr/local/opt/libomp'
-    if os.path.exists(omp_prefix):
-        extra_compile_args += ['-Xpreprocessor', '-fopenmp']
-        include_dirs.append(f'{omp_prefix}/include')
-        library_dirs.append(f'{omp_prefix}/lib')
-        libraries.append('omp')
-    else:
-        print("Warning: libomp not found. Install with: brew install libomp")
+    # macOS - use libomp from Homebrew (Apple Silicon or Intel prefix)
+    omp_prefix = next((prefix for prefix in ('/opt/homebrew/opt/libomp', '/usr/local/opt/libomp')
+                       if os.path.exists(prefix)), None)
+    if omp_prefix is None:
+        # The extension refuses to compile without OpenMP, so fail early
+        # with the fix rather than with a compiler error
+        sys.exit("Error: libomp not found. Install with: brew install libomp")
+    extra_compile_args += ['-Xpreprocessor', '-fopenmp']
+    include_dirs.append(f'{omp_prefix}/include')
+    library_dirs.append(f'{omp_prefix}/lib')
+    libraries.append('omp')
 else:
     # Linux and other platforms
     extra_compile_args.append('-fopenmp')
@@ -62,8 +69,12 @@ setup(
     ext_modules=ext_modules,
     install_requires=[
         "pybind11>=2.6.0",
+        "numpy>=1.17.0",
         "tqdm>=4.0.0",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+    },
     setup_requires=[
         "pybind11>=2.6.0",
     ],